@@ -138,6 +138,21 @@ if DATABASE_URL:
         conn_health_checks=True,
     )
 
+# Shared cache (Redis) when REDIS_URL is set; otherwise Django's per-process
+# local-memory cache is used
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+
+# Covering indexes (Index(include=...)) are PostgreSQL-only; on the SQLite dev
+# database the INCLUDE columns are dropped, which is expected.
+SILENCED_SYSTEM_CHECKS = ['models.W040']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -169,9 +184,14 @@ SESSION_EXPIRE_AT_BROWSER_CLOSE = True  # End session when browser closes
 SESSION_SAVE_EVERY_REQUEST = True  # Refresh session on each request
 SESSION_COOKIE_HTTPONLY = True  # Prevent JavaScript access to session cookie
 SESSION_COOKIE_SAMESITE = 'Lax'  # CSRF protection
+if REDIS_URL:
+    # Read sessions from Redis, writing through to the DB; only with a shared cache,
+    # since a per-process cache would keep serving sessions flushed by another worker
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 
 AUTHENTICATION_BACKENDS = [
-    'django.contrib.auth.backends.ModelBackend',
+    # ModelBackend that also joins the UserProfile when loading request.user
+    'accounts.backends.ProfileModelBackend',
 ]
 
 # Internationalization
@@ -219,6 +239,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # Scoped rates; views opt in with throttle_scope
+    'DEFAULT_THROTTLE_RATES': {
+        'auth_token': '10/min',  # POST /api/auth/token/ (password hashing per attempt)
+    },
 }
 
 # Simple JWT settings
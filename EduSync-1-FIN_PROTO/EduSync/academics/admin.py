@@ -1,5 +1,52 @@
+from datetime import timedelta
+
 from django.contrib import admin
-from .models import Course, Grade, AttendanceSheet, Attendance, Branch, AcademicCalendar, CalendarEvent, EventTypeColor
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import CharField, Count, Sum, Value
+from django.db.models.functions import Concat
+from django.utils import timezone
+from django.utils.functional import cached_property
+from .models import Course, Grade, AttendanceSheet, Attendance, Branch, Term, AcademicCalendar, CalendarEvent, EventTypeColor
+
+
+def _is_changelist(request):
+    """True when the admin request renders a changelist (not a change form)."""
+    match = getattr(request, 'resolver_match', None)
+    return bool(match and match.url_name and match.url_name.endswith('_changelist'))
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that reads the planner's row estimate for unfiltered PostgreSQL
+    changelists instead of running COUNT(*) over the whole table.
+    Filtered lists and other databases use the exact count.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where:
+            connection = connections[queryset.db]
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                # reltuples is -1/0 until the table has been analyzed
+                if row and row[0] > 0:
+                    return row[0]
+        return super().count
+
+
+class HighVolumeAdminMixin:
+    """Changelist settings for tables that grow with every student/day."""
+    list_per_page = 50
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
 @admin.register(Course)
@@ -14,15 +61,25 @@ class CourseAdmin(admin.ModelAdmin):
     search_fields = (
         'code', 'name'
     )
-    filter_horizontal = (
+    raw_id_fields = (
         'teachers',
     )
+    list_select_related = (
+        'institution',
+    )
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('institution').prefetch_related('teachers')
+        if _is_changelist(request):
+            # skip the description TextField on the list; the change form still loads every column
+            qs = qs.only('code', 'name', 'credits', 'display_label', 'institution__name')
+        return qs
 
 
 @admin.register(Grade)
-class GradeAdmin(admin.ModelAdmin):
+class GradeAdmin(HighVolumeAdminMixin, admin.ModelAdmin):
     list_display = (
-        'student', 'course',
+        'student_label', 'course',
         'grade', 'marks'
     )
     list_filter = (
@@ -32,18 +89,85 @@ class GradeAdmin(admin.ModelAdmin):
         'student__user__username',
         'course__code'
     )
+    list_select_related = (
+        'course',
+    )
+
+    def get_queryset(self, request):
+        # build the "STUDENT_ID - Full Name" label in SQL instead of loading Student/User per row;
+        # the joins serve __str__ on the change form, history log and FK widgets
+        return super().get_queryset(request).select_related('student__user', 'course').annotate(
+            student_label=Concat(
+                'student__student_id', Value(' - '),
+                'student__user__first_name', Value(' '), 'student__user__last_name',
+                output_field=CharField(),
+            )
+        )
+
+    @admin.display(description='Student', ordering='student__student_id')
+    def student_label(self, obj):
+        return obj.student_label
 
 
 @admin.register(AttendanceSheet)
 class AttendanceSheetAdmin(admin.ModelAdmin):
-    list_display = ('teacher', 'department', 'date_from', 'date_to', 'total_lectures', 'shared_with_students')
+    list_display = ('teacher', 'department', 'date_from', 'date_to', 'total_lectures', 'n_attendance', 'n_present', 'shared_with_students')
     list_filter = ('shared_with_students', 'department')
+    list_select_related = ('teacher__user', 'department')
+    search_fields = ('teacher__employee_id', 'teacher__user__username', 'department__name')
+    ordering = ('-created_at',)
+
+    def get_queryset(self, request):
+        # per-sheet totals come from one aggregated query instead of a count per row;
+        # __str__ (change form, history log, attendance autocomplete) reads teacher and department
+        return super().get_queryset(request).select_related('teacher__user', 'department').annotate(
+            n_attendance=Count('attendance_records'),
+            n_present=Sum('attendance_records__lectures_attended'),
+        )
+
+    @admin.display(description='Students', ordering='n_attendance')
+    def n_attendance(self, obj):
+        return obj.n_attendance
+
+    @admin.display(description='Lectures attended', ordering='n_present')
+    def n_present(self, obj):
+        return obj.n_present or 0
+
+
+class SheetDateRangeFilter(admin.SimpleListFilter):
+    """Filter attendance by how recently its sheet period started, without listing every sheet."""
+    title = 'sheet period'
+    parameter_name = 'sheet_period'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('30', 'Last 30 days'),
+            ('60', 'Last 60 days'),
+            ('90', 'Last 90 days'),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() in ('30', '60', '90'):
+            since = timezone.localdate() - timedelta(days=int(self.value()))
+            return queryset.filter(sheet__date_from__gte=since)
+        return queryset
 
 
 @admin.register(Attendance)
-class AttendanceAdmin(admin.ModelAdmin):
+class AttendanceAdmin(HighVolumeAdminMixin, admin.ModelAdmin):
     list_display = ('student', 'sheet', 'lectures_attended', 'total_lectures')
-    list_filter = ('sheet',)
+    list_filter = (SheetDateRangeFilter,)
+    list_select_related = ('student__user', 'sheet__teacher__user', 'sheet__department')
+    search_fields = ('student__student_id', 'student__user__username')
+    autocomplete_fields = ('student', 'sheet')
+
+    def get_queryset(self, request):
+        # __str__ reads the student and the sheet's total; join them for the change form and history log too
+        return super().get_queryset(request).select_related('student__user', 'sheet__teacher__user', 'sheet__department')
+
+    @admin.display(description='Total lectures', ordering='sheet__total_lectures')
+    def total_lectures(self, obj):
+        return obj.sheet.total_lectures
 
 
 @admin.register(Branch)
@@ -51,22 +175,43 @@ class BranchAdmin(admin.ModelAdmin):
     list_display = ('name', 'department', 'institution')
     list_filter = ('institution', 'department')
     search_fields = ('name',)
+    list_select_related = ('department', 'institution')
+
+
+@admin.register(Term)
+class TermAdmin(admin.ModelAdmin):
+    list_display = ('name', 'year')
+    search_fields = ('name', 'year')
 
 
 @admin.register(AcademicCalendar)
 class AcademicCalendarAdmin(admin.ModelAdmin):
-    list_display = ('semester', 'year', 'department', 'created_by', 'shared_with_students', 'shared_with_teachers', 'created_at')
+    list_display = ('term', 'department', 'created_by', 'shared_with_students', 'shared_with_teachers', 'created_at')
     list_filter = ('shared_with_students', 'shared_with_teachers', 'department')
-    search_fields = ('semester', 'year')
+    search_fields = ('term__name', 'term__year')
     ordering = ('-created_at',)
+    list_select_related = ('term', 'department', 'created_by')
+    autocomplete_fields = ('term',)
+
+    def get_queryset(self, request):
+        # __str__ shows the term, so autocomplete results and FK widgets need it joined too
+        return super().get_queryset(request).select_related('term')
 
 
 @admin.register(CalendarEvent)
-class CalendarEventAdmin(admin.ModelAdmin):
-    list_display = ('date', 'title', 'type', 'color_code', 'calendar')
+class CalendarEventAdmin(HighVolumeAdminMixin, admin.ModelAdmin):
+    list_display = ('date', 'end_date', 'recurrence', 'title', 'type', 'color_code', 'calendar')
     list_filter = ('type', 'calendar')
     search_fields = ('title', 'description')
     ordering = ('date',)
+    list_select_related = ('calendar__term',)
+    autocomplete_fields = ('calendar',)
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _is_changelist(request):
+            qs = qs.only('date', 'end_date', 'recurrence', 'title', 'type', 'color_code', 'calendar__term__name', 'calendar__term__year')
+        return qs
 
 
 @admin.register(EventTypeColor)
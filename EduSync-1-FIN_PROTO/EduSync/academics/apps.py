@@ -1,6 +1,20 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class AcademicsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'academics'
+
+    def ready(self):
+        # register signal handlers; this only connects receivers and must not query the database
+        from . import signals  # noqa: F401
+        post_migrate.connect(_install_updated_at_triggers, sender=self)
+
+
+def _install_updated_at_triggers(using, **kwargs):
+    """Restore the updated_at triggers, which SQLite drops whenever a migration rebuilds a table."""
+    from django.db import connections
+
+    from .triggers import install_updated_at_triggers
+    install_updated_at_triggers(connections[using])
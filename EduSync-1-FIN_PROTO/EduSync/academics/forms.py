@@ -1,7 +1,32 @@
 from django import forms
-from .models import Course, AcademicCalendar, CalendarEvent
+from django.core.cache import cache
+from .models import Course, AcademicCalendar, CalendarEvent, Term
 from institution.models import Department
 
+# (pk, name) department choices per institution; dropped by academics.signals when a Department changes
+DEPARTMENT_CHOICES_CACHE_KEY = 'academics:department_choices:{}'
+DEPARTMENT_CHOICES_TIMEOUT = 300
+
+# static event type data, computed once at import for the CalendarEventForm widgets/defaults
+# (pure Python: DB-backed colors are only resolved inside __init__/clean)
+_EVENT_TYPE_CHOICES = tuple(CalendarEvent.EVENT_TYPES)
+_DEFAULT_EVENT_COLOR = '#2563EB'
+
+
+def limit_department_field(field, institution):
+    """Restrict a department ModelChoiceField to `institution`, rendering its options from cache."""
+    # options only need pk/name; skip the description and timestamp columns
+    field.queryset = Department.objects.filter(institution=institution).only('pk', 'name')
+    choices = cache.get_or_set(
+        DEPARTMENT_CHOICES_CACHE_KEY.format(institution.pk),
+        lambda: list(field.queryset.values_list('pk', 'name')),
+        DEPARTMENT_CHOICES_TIMEOUT,
+    )
+    # the queryset still validates submitted values; only the option list comes from cache
+    if field.empty_label is not None:
+        choices = [('', field.empty_label)] + choices
+    field.choices = choices
+
 
 class CourseForm(forms.ModelForm):
     class Meta:
@@ -19,8 +44,7 @@ class CourseForm(forms.ModelForm):
     def __init__(self, *args, institution=None, **kwargs):
         super().__init__(*args, **kwargs)
         if institution:
-            from institution.models import Department
-            self.fields['department'].queryset = Department.objects.filter(institution=institution)
+            limit_department_field(self.fields['department'], institution)
 
 
 class AcademicCalendarForm(forms.ModelForm):
@@ -31,14 +55,15 @@ class AcademicCalendarForm(forms.ModelForm):
         label='Department',
         help_text='Optional — leave blank to make calendar available to all departments'
     )
+    # semester/year are typed as text and resolved to a shared Term row on save
+    semester = forms.CharField(max_length=30, widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "Semester 1"}))
+    year = forms.CharField(max_length=20, widget=forms.TextInput(attrs={"class": "form-control", "placeholder": "2026-2027"}))
 
     class Meta:
         model = AcademicCalendar
         # expose department + share flags so admins can set visibility from the edit form
         fields = ["semester", "year", "department", "shared_with_students", "shared_with_teachers"]
         widgets = {
-            "semester": forms.TextInput(attrs={"class": "form-control", "placeholder": "Semester 1"}),
-            "year": forms.TextInput(attrs={"class": "form-control", "placeholder": "2026-2027"}),
             "shared_with_students": forms.CheckboxInput(attrs={"class": "form-check-input"}),
             "shared_with_teachers": forms.CheckboxInput(attrs={"class": "form-check-input"}),
         }
@@ -48,48 +73,66 @@ class AcademicCalendarForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
         # limit department choices to the user's institution when provided
         if institution:
-            self.fields['department'].queryset = Department.objects.filter(institution=institution)
+            limit_department_field(self.fields['department'], institution)
         else:
-            self.fields['department'].queryset = Department.objects.all()
+            self.fields['department'].queryset = Department.objects.only('pk', 'name')
+        if self.instance.term_id:
+            self.initial.setdefault('semester', self.instance.term.name)
+            self.initial.setdefault('year', self.instance.term.year)
+
+    def save(self, commit=True):
+        self.instance.term, _ = Term.objects.get_or_create(
+            name=self.cleaned_data['semester'].strip(), year=self.cleaned_data['year'].strip()
+        )
+        return super().save(commit=commit)
 
 
 class CalendarEventForm(forms.ModelForm):
-    # Optional end date lets admin create the same event across a date range (inclusive).
-    end_date = forms.DateField(required=False, widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}), help_text='Optional — create this event on every date from Date → End date')
+    # Optional end date stores the event once across a date range (inclusive); `recurrence` picks the days.
+    end_date = forms.DateField(required=False, widget=forms.DateInput(attrs={"class": "form-control", "type": "date"}), help_text='Optional — repeat this event from Date → End date')
 
     class Meta:
         model = CalendarEvent
         # simplified form: no free-text title/description — title will be derived from `type`
-        fields = ["date", "end_date", "type", "color_code"]
+        fields = ["date", "end_date", "recurrence", "type", "color_code"]
         widgets = {
             "date": forms.DateInput(attrs={"class": "form-control", "type": "date"}),
+            "recurrence": forms.Select(attrs={"class": "form-select"}),
             # make `type` editable (text input) but provide suggestions via datalist
-            "type": forms.TextInput(attrs={"class": "form-control", "list": "event-type-suggestions", "event_type_choices": CalendarEvent.EVENT_TYPES}),
-            "color_code": forms.TextInput(attrs={"class": "form-control", "type": "color", "value": "#2563EB"}),
+            "type": forms.TextInput(attrs={"class": "form-control", "list": "event-type-suggestions", "event_type_choices": _EVENT_TYPE_CHOICES}),
+            "color_code": forms.TextInput(attrs={"class": "form-control", "type": "color", "value": _DEFAULT_EVENT_COLOR}),
         }
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # allow omission of color in POST; server will default it based on type
+        # allow omission of color/recurrence in POST; server will default them
         self.fields['color_code'].required = False
+        self.fields['recurrence'].required = False
 
         # prefer provided initial color -> instance color -> default by type
-        provided = self.initial.get('color_code') or (getattr(self.instance, 'color_code', None) if hasattr(self, 'instance') else None)
+        # fast path: an explicit initial color needs no further lookups
+        if self.initial.get('color_code'):
+            return
+        # ModelForm always sets self.instance, so read it directly
+        provided = self.instance.color_code
         if not provided:
-            type_key = self.initial.get('type') or (getattr(self.instance, 'type', None) if getattr(self.instance, 'pk', None) else None)
+            type_key = self.initial.get('type') or (self.instance.type if self.instance.pk else None)
             if type_key:
                 # use DB overrides when present
-                self.fields['color_code'].initial = CalendarEvent.get_type_color_mapping().get(type_key, '#2563EB')
+                self.fields['color_code'].initial = CalendarEvent.resolved_colors().get(type_key, _DEFAULT_EVENT_COLOR)
 
     def clean(self):
         cleaned = super().clean()
         color = cleaned.get('color_code')
         ev_type = cleaned.get('type')
         start_date = cleaned.get('date')
-        end_date = cleaned.get('end_date')
 
-        if end_date and start_date and end_date < start_date:
-            raise forms.ValidationError('End date cannot be earlier than the start date.')
+        # editing onto another event's calendar/date/title would break the unique constraint
+        # (the title follows the type); the create view keeps an existing event instead
+        if self.instance.pk and start_date and ev_type and CalendarEvent.objects.filter(
+            calendar_id=self.instance.calendar_id, date=start_date, title=ev_type
+        ).exclude(pk=self.instance.pk).exists():
+            raise forms.ValidationError('An event of this type already starts on that date.')
 
         if not color:
             # fill server-side default (DB override preferred)
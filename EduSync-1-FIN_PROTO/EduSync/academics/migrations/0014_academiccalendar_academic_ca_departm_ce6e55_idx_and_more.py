@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0013_academiccalendar_institution'),
+        ('institution', '0008_academiccalendarevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academiccalendar',
+            index=models.Index(fields=['department', 'shared_with_students'], name='academic_ca_departm_ce6e55_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['calendar', 'date'], name='calendar_ev_calenda_5121dd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['type'], name='calendar_ev_type_c69072_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0014_academiccalendar_academic_ca_departm_ce6e55_idx_and_more'),
+        ('institution', '0008_academiccalendarevent'),
+        ('teacher', '0008_teacher_branch'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='attendancesheet',
+            constraint=models.CheckConstraint(condition=models.Q(('date_to__gte', models.F('date_from'))), name='attendance_sheet_date_to_gte_date_from'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:44
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def expand_ranged_events(apps, schema_editor):
+    # Before end_date every day of an event was its own row; migrating backwards, give each
+    # occurrence after the start date its own copy so ranged events don't shrink to one day
+    CalendarEvent = apps.get_model('academics', 'CalendarEvent')
+    copied = [f.attname for f in CalendarEvent._meta.concrete_fields
+              if f.attname not in ('id', 'date', 'end_date', 'recurrence')]
+    rows = []
+    for event in CalendarEvent.objects.filter(end_date__gt=F('date')).iterator():
+        step = timedelta(days=7 if event.recurrence == 'weekly' else 1)
+        day = event.date + step
+        while day <= event.end_date:
+            rows.append(CalendarEvent(date=day, **{name: getattr(event, name) for name in copied}))
+            day += step
+    CalendarEvent.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_attendancesheet_attendance_sheet_date_to_gte_date_from'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarevent',
+            name='end_date',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarevent',
+            name='recurrence',
+            field=models.CharField(choices=[('daily', 'Every day'), ('weekly', 'Every week')], default='daily', max_length=10),
+        ),
+        migrations.AddConstraint(
+            model_name='calendarevent',
+            constraint=models.CheckConstraint(condition=models.Q(('end_date__isnull', True), ('end_date__gte', models.F('date')), _connector='OR'), name='calendar_event_end_date_gte_date'),
+        ),
+        # Forwards there is nothing to collapse: existing rows are single-day events
+        migrations.RunPython(migrations.RunPython.noop, expand_ranged_events),
+    ]
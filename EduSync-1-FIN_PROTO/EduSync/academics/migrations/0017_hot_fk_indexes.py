@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0016_calendarevent_end_date_calendarevent_recurrence_and_more'),
+        ('institution', '0008_academiccalendarevent'),
+        ('student', '0007_student_branch_student_phone'),
+        ('teacher', '0008_teacher_branch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='academiccalendar',
+            index=models.Index(fields=['institution', 'semester', 'year'], name='academic_ca_institu_3208cb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendancesheet',
+            index=models.Index(fields=['teacher', 'date_from', 'date_to'], name='academics_a_teacher_38f766_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='attendancesheet',
+            index=models.Index(fields=['department', 'date_from'], name='academics_a_departm_43ce3a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='branch',
+            index=models.Index(fields=['institution', 'department'], name='academics_b_institu_161fec_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['student', 'grade'], name='academics_g_student_7475bc_idx'),
+        ),
+    ]
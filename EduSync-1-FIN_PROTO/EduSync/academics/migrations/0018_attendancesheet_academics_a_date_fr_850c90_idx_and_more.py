@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0017_hot_fk_indexes'),
+        ('institution', '0008_academiccalendarevent'),
+        ('teacher', '0008_teacher_branch'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendancesheet',
+            index=models.Index(fields=['date_from', 'date_to'], name='academics_a_date_fr_850c90_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='calendarevent',
+            index=models.Index(fields=['date'], name='calendar_ev_date_a999d5_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0018_attendancesheet_academics_a_date_fr_850c90_idx_and_more'),
+        ('student', '0007_student_branch_student_phone'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='calendarevent',
+            constraint=models.CheckConstraint(condition=models.Q(('type__in', ['Regular Teaching', 'Test', 'Reading Holiday', 'Public Holiday', 'Semester Break', 'Festival Holiday', 'Project / Practical Evaluation'])), name='calendar_event_type_valid'),
+        ),
+        migrations.AddConstraint(
+            model_name='grade',
+            constraint=models.CheckConstraint(condition=models.Q(('grade__in', ['A', 'B', 'C', 'D', 'F'])), name='grade_letter_valid'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:56
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery
+
+logger = logging.getLogger(__name__)
+
+
+def report_drifted_totals(apps, schema_editor):
+    # Rows whose own total differs from their sheet's (e.g. edited in the admin) lose
+    # that value with the column; log them so the old numbers are not gone without a trace
+    Attendance = apps.get_model('academics', 'Attendance')
+    drifted = list(
+        Attendance.objects.exclude(total_lectures=F('sheet__total_lectures'))
+        .values_list('id', 'sheet_id', 'total_lectures', 'sheet__total_lectures')
+        .order_by('id')
+    )
+    if drifted:
+        logger.warning(
+            "academics.0020: %d attendance row(s) had a total_lectures different from their sheet's;"
+            " the sheet's total is used from now on. (attendance id, sheet id, row total, sheet total): %s",
+            len(drifted), ', '.join(str(row) for row in drifted),
+        )
+
+
+def restore_totals_from_sheets(apps, schema_editor):
+    Attendance = apps.get_model('academics', 'Attendance')
+    AttendanceSheet = apps.get_model('academics', 'AttendanceSheet')
+    Attendance.objects.update(total_lectures=Subquery(
+        AttendanceSheet.objects.filter(id=OuterRef('sheet_id')).values('total_lectures')[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0019_calendarevent_calendar_event_type_valid_and_more'),
+    ]
+
+    operations = [
+        # Nullable first so that, migrating backwards, the re-added column accepts the
+        # existing rows until restore_totals_from_sheets fills it (the reverse of this
+        # AlterField then restores NOT NULL)
+        migrations.AlterField(
+            model_name='attendance',
+            name='total_lectures',
+            field=models.PositiveIntegerField(null=True),
+        ),
+        migrations.RunPython(report_drifted_totals, restore_totals_from_sheets),
+        migrations.RemoveField(
+            model_name='attendance',
+            name='total_lectures',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0020_remove_attendance_total_lectures'),
+        ('institution', '0008_academiccalendarevent'),
+        ('student', '0007_student_branch_student_phone'),
+        ('teacher', '0008_teacher_branch'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='attendance',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='attendancesheet',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='course',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='grade',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='attendance',
+            constraint=models.UniqueConstraint(fields=('sheet', 'student'), name='attendance_unique_sheet_student'),
+        ),
+        migrations.AddConstraint(
+            model_name='attendancesheet',
+            constraint=models.UniqueConstraint(fields=('teacher', 'department', 'date_from', 'date_to'), name='attendance_sheet_unique_period'),
+        ),
+        migrations.AddConstraint(
+            model_name='course',
+            constraint=models.UniqueConstraint(fields=('institution', 'code'), name='course_unique_institution_code'),
+        ),
+        migrations.AddConstraint(
+            model_name='grade',
+            constraint=models.UniqueConstraint(fields=('student', 'course'), name='grade_unique_student_course'),
+        ),
+    ]
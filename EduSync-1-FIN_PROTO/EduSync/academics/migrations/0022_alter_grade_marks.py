@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 08:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0021_unique_constraints'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='grade',
+            name='marks',
+            field=models.DecimalField(decimal_places=2, max_digits=5),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:01
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0022_alter_grade_marks'),
+        ('institution', '0008_academiccalendarevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='created_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='academic_calendars', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='academiccalendar',
+            index=models.Index(fields=['created_by', 'created_at'], name='academic_ca_created_115c34_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0023_alter_academiccalendar_created_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='academiccalendar',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='attendance',
+            options={},
+        ),
+        migrations.AlterModelOptions(
+            name='attendancesheet',
+            options={},
+        ),
+    ]
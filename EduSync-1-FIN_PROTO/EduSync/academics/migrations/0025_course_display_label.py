@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:04
+
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+
+def fill_display_label(apps, schema_editor):
+    Course = apps.get_model('academics', 'Course')
+    Course.objects.update(display_label=Concat('code', Value(' - '), 'name'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0024_alter_academiccalendar_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='display_label',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=250),
+        ),
+        migrations.RunPython(fill_display_label, migrations.RunPython.noop),
+    ]
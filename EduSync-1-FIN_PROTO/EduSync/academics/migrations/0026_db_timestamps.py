@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:08
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+from academics.triggers import drop_updated_at_triggers, install_updated_at_triggers
+
+
+def install_triggers(apps, schema_editor):
+    install_updated_at_triggers(schema_editor.connection)
+
+
+def drop_triggers(apps, schema_editor):
+    drop_updated_at_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0025_course_display_label'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='attendancesheet',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='attendancesheet',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='calendarevent',
+            name='created_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='calendarevent',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.AlterField(
+            model_name='eventtypecolor',
+            name='updated_at',
+            field=models.DateTimeField(db_default=django.db.models.functions.datetime.Now(), editable=False),
+        ),
+        migrations.RunPython(install_triggers, drop_triggers),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def move_to_terms(apps, schema_editor):
+    AcademicCalendar = apps.get_model('academics', 'AcademicCalendar')
+    Term = apps.get_model('academics', 'Term')
+    pairs = set(AcademicCalendar.objects.values_list('semester', 'year'))
+    Term.objects.bulk_create([Term(name=name, year=year) for name, year in pairs])
+    for term in Term.objects.all():
+        AcademicCalendar.objects.filter(semester=term.name, year=term.year).update(term=term)
+
+
+def move_from_terms(apps, schema_editor):
+    AcademicCalendar = apps.get_model('academics', 'AcademicCalendar')
+    Term = apps.get_model('academics', 'Term')
+    for term in Term.objects.all():
+        AcademicCalendar.objects.filter(term=term).update(semester=term.name, year=term.year)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0026_db_timestamps'),
+        ('institution', '0008_academiccalendarevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Term',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=30)),
+                ('year', models.CharField(max_length=20)),
+            ],
+            options={
+                'ordering': ['-year', 'name'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='term',
+            constraint=models.UniqueConstraint(fields=('name', 'year'), name='term_unique_name_year'),
+        ),
+        migrations.AddField(
+            model_name='academiccalendar',
+            name='term',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='calendars', to='academics.term'),
+        ),
+        # Made nullable before the data copy so that, migrating backwards, the re-added
+        # columns accept the existing rows until move_from_terms fills them (the reverse
+        # of these AlterFields then restores NOT NULL)
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='semester',
+            field=models.CharField(max_length=30, null=True),
+        ),
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='year',
+            field=models.CharField(max_length=20, null=True),
+        ),
+        migrations.RunPython(move_to_terms, move_from_terms),
+        migrations.RemoveIndex(
+            model_name='academiccalendar',
+            name='academic_ca_institu_3208cb_idx',
+        ),
+        migrations.RemoveField(
+            model_name='academiccalendar',
+            name='semester',
+        ),
+        migrations.RemoveField(
+            model_name='academiccalendar',
+            name='year',
+        ),
+        migrations.AlterField(
+            model_name='academiccalendar',
+            name='term',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='calendars', to='academics.term'),
+        ),
+        migrations.AddIndex(
+            model_name='academiccalendar',
+            index=models.Index(fields=['institution', 'term'], name='academic_ca_institu_1df62e_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0027_term_lookup'),
+        ('student', '0007_student_branch_student_phone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['student'], include=('course', 'grade', 'marks'), name='grade_student_covering'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:19
+
+import logging
+
+from django.db import migrations, models
+from django.db.models import Min
+
+logger = logging.getLogger(__name__)
+
+
+def drop_duplicate_events(apps, schema_editor):
+    CalendarEvent = apps.get_model('academics', 'CalendarEvent')
+    duplicates = (
+        CalendarEvent.objects.values('calendar', 'date', 'title')
+        .annotate(keep_id=Min('id'), n=models.Count('id'))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    # Only the oldest event of each (calendar, date, title) is kept; log the others' values
+    # so what the constraint removes is not gone without a trace
+    dropped = []
+    for row in duplicates:
+        extra = CalendarEvent.objects.filter(
+            calendar=row['calendar'], date=row['date'], title=row['title']
+        ).exclude(id=row['keep_id'])
+        dropped.extend(
+            (event_id, row['keep_id'], *rest) for event_id, *rest in
+            extra.values_list('id', 'calendar_id', 'date', 'end_date', 'type', 'recurrence', 'color_code', 'description')
+        )
+        extra.delete()
+    if dropped:
+        logger.warning(
+            "academics.0029: deleted %d duplicate calendar event(s); the oldest event per calendar, date and"
+            " title is kept. (event id, kept id, calendar id, date, end date, type, recurrence, color, description): %s",
+            len(dropped), ', '.join(str(row) for row in dropped),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0028_grade_student_covering'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_events, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='calendarevent',
+            constraint=models.UniqueConstraint(fields=('calendar', 'date', 'title'), name='calendar_event_unique_day_title'),
+        ),
+        migrations.RemoveIndex(
+            model_name='calendarevent',
+            name='calendar_ev_calenda_5121dd_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 10:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0029_calendar_event_unique_day_title'),
+    ]
+
+    operations = [
+        migrations.AlterConstraint(
+            model_name='calendarevent',
+            name='calendar_event_end_date_gte_date',
+            constraint=models.CheckConstraint(condition=models.Q(('end_date__isnull', True), ('end_date__gte', models.F('date')), _connector='OR'), name='calendar_event_end_date_gte_date', violation_error_message='End date cannot be earlier than the start date.'),
+        ),
+    ]
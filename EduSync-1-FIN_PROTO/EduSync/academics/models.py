@@ -26,14 +26,49 @@
 # 5. Event types define different kinds of academic activities
 # ================================================================================
 
-# Import Django's database models and settings
+# Import Python's memoization helpers and the time source for cache stamps
+import time
+from datetime import timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+# Import Django's database models, settings and cache framework
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.functions import Cast, Now, Round
 # Import related models from other apps  
 from teacher.models import Teacher
 from institution.models import Institution
 
 
+def _related_label(instance, field_name):
+    """
+    Label for a ForeignKey used by __str__ without triggering a query.
+    
+    Returns str() of the related object when it is already loaded
+    (select_related, prefetch or prior access), otherwise "#<id>".
+    Keeps admin lists, logging and debugging from issuing one SELECT per row.
+    """
+    field = instance._meta.get_field(field_name)
+    if field.is_cached(instance):
+        return str(getattr(instance, field_name))
+    return f"#{getattr(instance, field.attname)}"
+
+
+class BranchQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: Branch queries for dropdowns and lists
+    """
+
+    def lite(self):
+        """
+        Loads only the columns dropdowns and lists display, leaving out the
+        description TextField. Accessing a skipped field still works but costs a query.
+        """
+        return self.only('id', 'name', 'institution_id', 'department_id')
+
+
 class Branch(models.Model):
     """
     WHAT THIS MODEL REPRESENTS:
@@ -90,6 +125,21 @@ class Branch(models.Model):
     # Useful for tracking when branches were established
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # MANAGER: Default manager with the BranchQuerySet helpers
+    objects = BranchQuerySet.as_manager()
+
+    class Meta:
+        """
+        META CLASS CONFIGURATION:
+        
+        indexes: Database performance optimization
+        - Index on ('institution', 'department'): branch lists and dropdowns
+          filtered by institution and then narrowed to one department
+        """
+        indexes = [
+            models.Index(fields=['institution', 'department']),
+        ]
+
     def __str__(self):
         """
         STRING REPRESENTATION:
@@ -101,6 +151,62 @@ class Branch(models.Model):
         return self.name
 
 
+# ================================================================================
+# COURSE LIST CACHE
+# ================================================================================
+# The course list is read far more often than courses change, so each
+# institution's table rows are cached and dropped when one of its courses is
+# saved or deleted (see academics/signals.py). Only the rows are cached; the page
+# itself is rendered per request, so flash messages and per-user controls stay live.
+# ================================================================================
+
+# Cache key of one institution's course list rows
+COURSE_ROWS_CACHE_KEY = 'academics:course_rows:{}'
+
+# Seconds cached rows live; bounds staleness for writes that bypass signals
+COURSE_ROWS_TIMEOUT = 300
+
+
+def invalidate_course_rows(institution_id):
+    """Drops the cached course list rows of the given institution."""
+    cache.delete(COURSE_ROWS_CACHE_KEY.format(institution_id))
+
+
+class CourseQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: Course queries with their common relations pre-loaded
+    """
+
+    def with_related(self):
+        """
+        Joins institution and department and prefetches teachers, so pages that
+        show those for many courses run a fixed number of queries.
+        """
+        return self.select_related('institution', 'department').prefetch_related('teachers')
+
+    def lite(self):
+        """
+        Loads only the columns course lists and dropdowns display, leaving out the
+        description TextField. Accessing a skipped field still works but costs a query.
+        """
+        return self.only('id', 'code', 'name', 'display_label', 'credits', 'institution_id', 'department_id')
+
+    def list_rows(self):
+        """
+        Plain dicts with the columns the course list table shows, ordered by code.
+        No Course instances are built, so a long list costs one small dict per row.
+        """
+        return self.values('id', 'code', 'name', 'credits').order_by('code')
+
+    def cached_rows(self, institution_id):
+        """list_rows() of one institution, served from the cache until a course changes."""
+        return cache.get_or_set(
+            COURSE_ROWS_CACHE_KEY.format(institution_id),
+            lambda: list(self.filter(institution_id=institution_id).list_rows()),
+            COURSE_ROWS_TIMEOUT,
+        )
+
+
 class Course(models.Model):
     """
     WHAT THIS MODEL REPRESENTS:
@@ -189,17 +295,30 @@ class Course(models.Model):
     # Automatically set when course record is created
     # Useful for tracking when courses were added to the system
     created_at = models.DateTimeField(auto_now_add=True)
+    
+    # FIELD: Display Label
+    # "CODE - NAME" string stored on save (see save() below)
+    # Dropdowns and autocomplete lists of many courses read one column
+    # instead of formatting each label in Python
+    # db_index=True supports label lookups; editable=False hides it from forms
+    display_label = models.CharField(max_length=250, editable=False, db_index=True, default='')
+
+    # MANAGER: Default manager with the CourseQuerySet helpers
+    objects = CourseQuerySet.as_manager()
 
     class Meta:
         """
         META CLASS CONFIGURATION:
         
-        unique_together: Ensures combination of institution and course code is unique
+        constraints: Ensures combination of institution and course code is unique
+        - UniqueConstraint 'course_unique_institution_code'
         - Prevents duplicate course codes within the same institution  
         - Allows same course code across different institutions
         - Example: Both Institution A and B can have "CS101" but A can't have two "CS101" courses
         """
-        unique_together = ('institution', 'code')
+        constraints = [
+            models.UniqueConstraint(fields=['institution', 'code'], name='course_unique_institution_code'),
+        ]
 
     def __str__(self):
         """
@@ -210,9 +329,62 @@ class Course(models.Model):
         EXAMPLES:
         - "CS101 - Introduction to Programming"
         - "MATH201 - Calculus II"
+        
+        Reads the stored display_label; unsaved instances format it on the fly.
         """
+        return self.display_label or self.build_display_label()
+
+    def build_display_label(self):
+        """Formats the "CODE - NAME" label stored in display_label."""
         return f"{self.code} - {self.name}"
 
+    def save(self, *args, **kwargs):
+        """
+        SAVE OVERRIDE: Refresh display_label from code and name
+        
+        Saves restricted with update_fields also write the label when they
+        touch code or name. Queryset .update() calls bypass save() and must
+        set display_label themselves.
+        """
+        self.display_label = self.build_display_label()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'code', 'name'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'display_label'}
+        super().save(*args, **kwargs)
+
+
+# GRADE LETTERS: Predefined letter grade options
+# Ensures consistent grading across the system
+# Module-level so Grade.Meta constraints can reference the values
+# TextChoices members are plain strings, so GradeLetter.A == 'A'
+class GradeLetter(models.TextChoices):
+    A = 'A', 'A'  # Excellent performance
+    B = 'B', 'B'  # Good performance
+    C = 'C', 'C'  # Satisfactory performance
+    D = 'D', 'D'  # Minimum passing performance
+    F = 'F', 'F'  # Failing performance
+
+
+class GradeQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: Grade queries with their common relations pre-loaded
+    """
+
+    def with_related(self):
+        """
+        Joins student (with its user, used by Student.__str__) and course, so
+        grade tables render without a query per row.
+        """
+        return self.select_related('student__user', 'course')
+
+    def transcript(self):
+        """
+        Flat transcript rows as dicts (course__code, course__name, grade, marks),
+        ordered by course code. Builds no Grade/Course instances; on PostgreSQL the
+        grade columns come from the 'grade_student_covering' index.
+        """
+        return self.values('course__code', 'course__name', 'grade', 'marks').order_by('course__code')
+
 
 class Grade(models.Model):
     """
@@ -242,15 +414,8 @@ class Grade(models.Model):
     - One Course can have multiple Grades (different students)
     """
     
-    # GRADE CHOICES: Predefined letter grade options
-    # Ensures consistent grading across the system
-    GRADE_CHOICES = [
-        ('A', 'A'),  # Excellent performance
-        ('B', 'B'),  # Good performance
-        ('C', 'C'),  # Satisfactory performance
-        ('D', 'D'),  # Minimum passing performance
-        ('F', 'F'),  # Failing performance
-    ]
+    # GRADE CHOICES: (value, label) pairs kept for existing callers
+    GRADE_CHOICES = GradeLetter.choices
 
     # FIELD: Student Assignment
     # ForeignKey links grade to the student who earned it
@@ -272,9 +437,10 @@ class Grade(models.Model):
     
     # FIELD: Numerical Marks
     # The numerical score that corresponds to the letter grade
-    # FloatField allows decimal values (e.g., 87.5, 92.3)
-    # Used for precise GPA calculations and detailed reporting
-    marks = models.FloatField()
+    # DecimalField stores exact values with up to 2 decimals (e.g., 87.5, 92.25)
+    # max_digits=5, decimal_places=2 covers 0.00 to 100.00 (and up to 999.99)
+    # Exact decimals keep SUM/AVG for GPA calculations free of float rounding
+    marks = models.DecimalField(max_digits=5, decimal_places=2)
     
     # FIELD: Assignment Date
     # Automatically set when grade record is created
@@ -282,16 +448,40 @@ class Grade(models.Model):
     # Useful for tracking when grades were entered/finalized
     date_assigned = models.DateTimeField(auto_now_add=True)
 
+    # MANAGER: Default manager with the GradeQuerySet helpers
+    objects = GradeQuerySet.as_manager()
+
     class Meta:
         """
         META CLASS CONFIGURATION:
         
-        unique_together: Ensures one grade per student per course
+        UniqueConstraint 'grade_unique_student_course': Ensures one grade per student per course
         - Prevents duplicate grade entries for the same student-course combination
         - If grade needs updating, existing record should be modified
         - Maintains data integrity for transcript generation
+        
+        indexes: Database performance optimization
+        - Index on ('student', 'grade'): per-student grade distribution and
+          GPA rollups read only the index instead of every grade row
+        - 'grade_student_covering': (student) INCLUDE (course, grade, marks) lets
+          GradeQuerySet.transcript() read a student's grades with an index-only scan.
+          The INCLUDE part is PostgreSQL only; SQLite builds a plain (student) index
+        
+        constraints: Database-level data integrity
+        - grade must be one of the GradeLetter values, also for bulk inserts
+          and scripts that skip model validation
         """
-        unique_together = ('student', 'course')
+        indexes = [
+            models.Index(fields=['student', 'grade']),
+            models.Index(fields=['student'], include=['course', 'grade', 'marks'], name='grade_student_covering'),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=['student', 'course'], name='grade_unique_student_course'),
+            models.CheckConstraint(
+                condition=models.Q(grade__in=GradeLetter.values),
+                name='grade_letter_valid',
+            ),
+        ]
 
     def __str__(self):
         """
@@ -302,8 +492,9 @@ class Grade(models.Model):
         EXAMPLES:
         - "ST001 - John Smith - CS101 - Introduction to Programming : A"
         - "ST002 - Mary Johnson - MATH201 - Calculus II : B"
+        - "#12 - #4 : A" when student/course were not loaded with the grade
         """
-        return f"{self.student} - {self.course} : {self.grade}"
+        return f"{_related_label(self, 'student')} - {_related_label(self, 'course')} : {self.grade}"
 
 
 class AttendanceSheet(models.Model):
@@ -363,15 +554,17 @@ class AttendanceSheet(models.Model):
     
     # FIELD: Creation Timestamp
     # When the attendance sheet was first created
-    # auto_now_add=True sets this once and never changes
+    # db_default=Now() lets the database fill it on INSERT, so save() and
+    # bulk_create() skip computing it in Python (the value is read back via RETURNING)
     # Useful for tracking when sheets were generated
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     
     # FIELD: Last Update Timestamp
     # When the attendance sheet was last modified
-    # auto_now=True updates this every time the record is saved
+    # Set by the database: db_default=Now() on INSERT and a trigger on every UPDATE
+    # (migration 0026), so QuerySet.update() and bulk_update() bump it too
     # Useful for tracking ongoing attendance updates
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
     
     # FIELD: Student Sharing Status
     # Boolean flag indicating if sheet is visible to students
@@ -383,17 +576,42 @@ class AttendanceSheet(models.Model):
         """
         META CLASS CONFIGURATION:
         
-        unique_together: Prevents duplicate sheets for same teacher/dept/period
+        UniqueConstraint 'attendance_sheet_unique_period': Prevents duplicate sheets for same teacher/dept/period
         - Ensures one sheet per teacher per department per time period
         - Prevents conflicting attendance records
         - Maintains data integrity for reporting
         
-        ordering: Default sort order for sheet queries
-        - ['-created_at'] sorts by creation date with newest first
-        - Helpful for displaying recent sheets first in interfaces
+        ordering: No default sort order
+        - Counts, existence checks and aggregates skip a needless ORDER BY
+        - Views that list sheets call .order_by('-created_at') themselves
+        
+        constraints: Database-level data integrity
+        - date_to must not be earlier than date_from
+        - Enforced by the database, so bulk and scripted inserts are covered too
+        
+        indexes: Database performance optimization
+        - Index on ('teacher', 'date_from', 'date_to'): a teacher's sheets for
+          a period across all departments
+        - Index on ('department', 'date_from'): department attendance reports
+          ordered or filtered by period start
+        - Index on ('date_from', 'date_to'): "which sheets cover this day"
+          lookups (date_from <= day <= date_to) across teachers/departments
         """
-        unique_together = ('teacher', 'department', 'date_from', 'date_to')
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['teacher', 'date_from', 'date_to']),
+            models.Index(fields=['department', 'date_from']),
+            models.Index(fields=['date_from', 'date_to']),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['teacher', 'department', 'date_from', 'date_to'],
+                name='attendance_sheet_unique_period',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(date_to__gte=models.F('date_from')),
+                name='attendance_sheet_date_to_gte_date_from',
+            ),
+        ]
 
     def __str__(self):
         """
@@ -404,8 +622,198 @@ class AttendanceSheet(models.Model):
         EXAMPLES:
         - "EMP001 - Dr. Smith - Computer Science (2024-01-01 to 2024-01-31)"
         - "EMP002 - Prof. Johnson - Mathematics (2024-02-01 to 2024-02-28)"
+        - "#3 - #1 (2024-01-01 to 2024-01-31)" when teacher/department were not loaded
         """
-        return f"{self.teacher} - {self.department.name} ({self.date_from} to {self.date_to})"
+        return f"{_related_label(self, 'teacher')} - {_related_label(self, 'department')} ({self.date_from} to {self.date_to})"
+
+
+# ================================================================================
+# ATTENDANCE SUMMARY CACHE
+# ================================================================================
+# The student dashboard shows totals over every shared attendance record of the
+# student (sheets, lectures attended, lectures conducted). The totals only change
+# when one of that student's records or sheets changes, so the aggregate is kept
+# in Django's cache per student and deleted on those writes (see
+# academics/signals.py and AttendanceQuerySet.bulk_upsert). A TTL bounds staleness
+# for writes that bypass both (queryset.update(), raw SQL).
+#
+# Per-sheet class statistics (attendance archives) are cached the same way, keyed
+# by sheet and dropped whenever a record on the sheet or the sheet itself changes.
+#
+# Both are only cached when REDIS_URL configures a shared cache. With Django's
+# per-process local-memory cache a delete reaches one worker only, and the others
+# would keep serving totals from before an attendance edit until the TTL ran out.
+# ================================================================================
+
+# Cache key of one student's shared attendance totals
+ATTENDANCE_SUMMARY_CACHE_KEY = 'academics:attendance_summary:{}'
+
+# Seconds a cached summary lives before it is recomputed
+ATTENDANCE_SUMMARY_TIMEOUT = 300
+
+
+# Cache key of one sheet's class statistics (students, average %, students below minimum)
+SHEET_SUMMARY_CACHE_KEY = 'academics:sheet_summary:{}'
+
+# Minimum attendance percentage most institutions require for exam eligibility
+ATTENDANCE_MIN_PERCENTAGE = 75
+
+
+def _attendance_summaries_cached():
+    """True when attendance summaries may be cached, i.e. the cache is shared by all workers."""
+    return bool(settings.REDIS_URL)
+
+
+def invalidate_attendance_summaries(student_ids):
+    """Drops the cached attendance totals of the given students."""
+    cache.delete_many([ATTENDANCE_SUMMARY_CACHE_KEY.format(student_id) for student_id in set(student_ids)])
+
+
+def invalidate_sheet_summaries(sheet_ids):
+    """Drops the cached class statistics of the given sheets."""
+    cache.delete_many([SHEET_SUMMARY_CACHE_KEY.format(sheet_id) for sheet_id in set(sheet_ids)])
+
+
+class AttendanceQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: Attendance queries with database-side calculations
+    
+    Exposed as Attendance.objects, so every helper below chains with the
+    usual filter()/select_related()/order_by() calls.
+    """
+
+    def with_related(self):
+        """
+        Joins the sheet's department and the student (with its user), the
+        relations attendance lists and Attendance.__str__ read.
+        """
+        return self.select_related('sheet__department', 'student__user')
+
+    def with_percentage(self):
+        """
+        Annotates each record with attendance_percentage computed in SQL.
+        
+        Uses the same rules as Attendance.attendance_percentage:
+        0 when the sheet held no lectures, otherwise attended ÷ total × 100
+        rounded to 2 decimal places. Rosters of hundreds of students get
+        their percentages from the same SELECT instead of Python arithmetic
+        per row.
+        
+        USAGE:
+        Attendance.objects.filter(sheet=sheet).with_percentage()
+        """
+        return self.annotate(
+            attendance_percentage=models.Case(
+                models.When(sheet__total_lectures=0, then=models.Value(0.0)),
+                # PostgreSQL rounds in NUMERIC; cast back so both backends yield floats
+                default=Cast(
+                    Round(models.F('lectures_attended') * 100.0 / models.F('sheet__total_lectures'), 2),
+                    models.FloatField(),
+                ),
+                output_field=models.FloatField(),
+            )
+        )
+
+    def bulk_upsert(self, sheet, rows, batch_size=1000):
+        """
+        Inserts or updates one Attendance per student on `sheet` in batches.
+        
+        PARAMETERS:
+        sheet: AttendanceSheet the records belong to
+        rows: iterable of (student_id, lectures_attended)
+        
+        Conflicts on the (sheet, student) unique key update lectures_attended
+        in place, so a whole class is written with a few INSERT ... ON CONFLICT
+        statements instead of one save() per student.
+        """
+        objs = [
+            self.model(sheet=sheet, student_id=student_id, lectures_attended=attended)
+            for student_id, attended in rows
+        ]
+        created = self.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['sheet', 'student'],
+            update_fields=['lectures_attended'],
+        )
+        # bulk_create sends no post_save signals, so drop cached totals here
+        invalidate_attendance_summaries(obj.student_id for obj in objs)
+        invalidate_sheet_summaries([sheet.pk])
+        return created
+
+    def shared_summary(self, student_id):
+        """
+        Totals over a student's attendance on sheets shared with students.
+        
+        RETURNS:
+        {'count': records, 'attended': lectures attended, 'lectures': lectures conducted}
+        
+        Computed with one aggregate query and, with a shared cache, cached per
+        student until one of the student's records or sheets changes.
+        """
+        def compute():
+            summary = self.filter(student_id=student_id, sheet__shared_with_students=True).aggregate(
+                count=models.Count('id'),
+                attended=models.Sum('lectures_attended'),
+                lectures=models.Sum('sheet__total_lectures'),
+            )
+            return {
+                'count': summary['count'],
+                'attended': summary['attended'] or 0,
+                'lectures': summary['lectures'] or 0,
+            }
+
+        if not _attendance_summaries_cached():
+            return compute()
+        return cache.get_or_set(
+            ATTENDANCE_SUMMARY_CACHE_KEY.format(student_id), compute, ATTENDANCE_SUMMARY_TIMEOUT
+        )
+
+    def sheet_summaries(self, sheet_ids):
+        """
+        Class statistics for each sheet in `sheet_ids`.
+        
+        RETURNS:
+        {sheet_id: {'students': records, 'avg_percentage': class average (2 dp),
+                    'below_minimum': records under ATTENDANCE_MIN_PERCENTAGE}}
+        
+        Uncached sheets are computed with a single grouped query. With a shared
+        cache, cached sheets are read with one get_many() and the computed ones
+        are cached until a record on the sheet changes.
+        """
+        use_cache = _attendance_summaries_cached()
+        keys = {sheet_id: SHEET_SUMMARY_CACHE_KEY.format(sheet_id) for sheet_id in set(sheet_ids)}
+        cached = cache.get_many(keys.values()) if use_cache else {}
+        summaries = {sheet_id: cached[key] for sheet_id, key in keys.items() if key in cached}
+        missing = [sheet_id for sheet_id in keys if sheet_id not in summaries]
+        if missing:
+            rows = (
+                self.filter(sheet_id__in=missing)
+                .with_percentage()
+                .order_by()
+                .values('sheet_id')
+                .annotate(
+                    students=models.Count('id'),
+                    avg_percentage=models.Avg('attendance_percentage'),
+                    below_minimum=models.Count(
+                        'id', filter=models.Q(attendance_percentage__lt=ATTENDANCE_MIN_PERCENTAGE)
+                    ),
+                )
+            )
+            computed = {sheet_id: {'students': 0, 'avg_percentage': 0.0, 'below_minimum': 0} for sheet_id in missing}
+            for row in rows:
+                computed[row['sheet_id']] = {
+                    'students': row['students'],
+                    'avg_percentage': round(row['avg_percentage'] or 0.0, 2),
+                    'below_minimum': row['below_minimum'],
+                }
+            if use_cache:
+                cache.set_many(
+                    {keys[sheet_id]: summary for sheet_id, summary in computed.items()}, ATTENDANCE_SUMMARY_TIMEOUT
+                )
+            summaries.update(computed)
+        return summaries
 
 
 class Attendance(models.Model):
@@ -422,7 +830,10 @@ class Attendance(models.Model):
     - Generate attendance reports and analytics
     
     ATTENDANCE CALCULATION:
-    Percentage = (lectures_attended / total_lectures) × 100
+    Percentage = (lectures_attended / sheet.total_lectures) × 100
+    
+    The lecture total lives only on the parent AttendanceSheet; every record
+    on a sheet shares it, so it is not repeated on each row.
     
     ACADEMIC IMPORTANCE:
     - Many institutions require minimum attendance (e.g., 75%) for exam eligibility
@@ -453,29 +864,32 @@ class Attendance(models.Model):
     # PositiveIntegerField ensures only positive values (including 0)
     # Default 0 for new records where attendance hasn't been marked yet
     lectures_attended = models.PositiveIntegerField(default=0)
-    
-    # FIELD: Total Lectures
-    # Total number of lectures conducted (should match sheet's total_lectures)
-    # PositiveIntegerField ensures only positive values
-    # Required field - used as denominator for percentage calculation
-    
-    total_lectures = models.PositiveIntegerField()
+
+    # MANAGER: Default manager with the AttendanceQuerySet helpers
+    objects = AttendanceQuerySet.as_manager()
+
+    # Holds the SQL-computed percentage when the queryset used with_percentage()
+    _attendance_percentage = None
+
     class Meta:
         """
         META CLASS CONFIGURATION:
         
-        unique_together: Ensures one attendance record per student per sheet
+        constraints: Ensures one attendance record per student per sheet
+        - UniqueConstraint 'attendance_unique_sheet_student', also the conflict
+          target for AttendanceQuerySet.bulk_upsert()
         - Prevents duplicate attendance records for same student in same period
         - Maintains data integrity for attendance calculations
         - Each student should have exactly one record per attendance sheet
         
-        ordering: Default sort order for attendance queries
-        - ['student__student_id'] sorts by student ID in ascending order
-        - Provides consistent ordering for attendance reports and lists
-        - Makes it easier to find specific student records
+        ordering: No default sort order
+        - Sorting by student ID needs a join on the student table, which
+          aggregates and the per-student summary queries do not need
+        - Roster views call .order_by('student__student_id') explicitly
         """
-        unique_together = ('sheet', 'student')
-        ordering = ['student__student_id']
+        constraints = [
+            models.UniqueConstraint(fields=['sheet', 'student'], name='attendance_unique_sheet_student'),
+        ]
 
     def __str__(self):
         """
@@ -486,10 +900,23 @@ class Attendance(models.Model):
         EXAMPLES:
         - "ST001 - John Smith - 18/20"
         - "ST002 - Mary Johnson - 15/20"
+        - "#12 - 18" when the student and sheet were not loaded with the record
         
         This format quickly shows attendance status for easy review.
+        The "/TOTAL" part needs the sheet and is left out when it is not loaded.
         """
-        return f"{self.student} - {self.lectures_attended}/{self.total_lectures}"
+        label = f"{_related_label(self, 'student')} - {self.lectures_attended}"
+        if self._meta.get_field('sheet').is_cached(self):
+            label += f"/{self.sheet.total_lectures}"
+        return label
+
+    @property
+    def total_lectures(self):
+        """
+        Total lectures conducted, read from the parent sheet.
+        Load records with select_related('sheet') when listing many of them.
+        """
+        return self.sheet.total_lectures
 
     @property
     def attendance_percentage(self):
@@ -513,19 +940,100 @@ class Attendance(models.Model):
         USAGE IN TEMPLATES:
         {{ attendance.attendance_percentage }}% displays calculated percentage
         
+        PERFORMANCE:
+        Records loaded through Attendance.objects.with_percentage() already
+        carry the value computed by the database; it is returned as-is.
+        
         ACADEMIC SIGNIFICANCE:
         - Most institutions require 75% minimum attendance
         - Used for exam eligibility decisions
         - Affects academic standing and progress
         - Required for regulatory compliance
         """
+        # Value annotated by with_percentage() → no Python arithmetic needed
+        if self._attendance_percentage is not None:
+            return self._attendance_percentage
+
+        # Lecture total comes from the parent sheet
+        total_lectures = self.total_lectures
+
         # Safety check: prevent division by zero
-        if self.total_lectures == 0:
+        if total_lectures == 0:
             return 0
         
         # Calculate percentage: (attended ÷ total) × 100
         # Round to 2 decimal places for clean display
-        return round((self.lectures_attended / self.total_lectures) * 100, 2)
+        return round((self.lectures_attended / total_lectures) * 100, 2)
+
+    @attendance_percentage.setter
+    def attendance_percentage(self, value):
+        """Receives the with_percentage() annotation when Django builds the instance."""
+        self._attendance_percentage = value
+
+
+class Term(models.Model):
+    """
+    WHAT THIS MODEL REPRESENTS:
+    One academic term (semester name + academic year), shared by every
+    calendar that covers it.
+    
+    PURPOSE:
+    - Store each semester/year pair once instead of repeating the text on every calendar
+    - Let calendar filters compare an integer key instead of two strings
+    
+    EXAMPLES:
+    - "Odd Semester" / "2025-2026"
+    - "Fall 2024" / "2024-2025"
+    """
+    
+    # FIELD: Semester Name
+    # Name of the academic semester or term
+    # Examples: "Fall 2024", "Spring 2025", "Summer Session", "First Semester"
+    # CharField with 30 characters handles various naming conventions
+    name = models.CharField(max_length=30)
+    
+    # FIELD: Academic Year
+    # Year or year range for the academic period  
+    # Examples: "2024", "2024-2025", "AY 2024-25"
+    # CharField with 20 characters handles different year formats
+    year = models.CharField(max_length=20)
+
+    class Meta:
+        """
+        META CLASS CONFIGURATION:
+        
+        constraints: Data integrity rules
+        - One row per (name, year); the same semester name recurs every year
+        
+        ordering: Newest year first, then by name (admin and dropdowns only;
+        the table stays tiny)
+        """
+        constraints = [
+            models.UniqueConstraint(fields=['name', 'year'], name='term_unique_name_year'),
+        ]
+        ordering = ['-year', 'name']
+
+    def __str__(self):
+        """
+        STRING REPRESENTATION:
+        
+        FORMAT: "SEMESTER (YEAR)"
+        EXAMPLE: "Odd Semester (2025-2026)"
+        """
+        return f"{self.name} ({self.year})"
+
+
+class AcademicCalendarQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: Calendar lookups shared by the calendar views
+    """
+
+    def for_institution(self, institution):
+        """
+        Calendars owned by `institution`: the ownership check of every calendar
+        view. Callers add the joins or only() columns their page reads.
+        """
+        return self.filter(institution=institution)
 
 
 class AcademicCalendar(models.Model):
@@ -561,17 +1069,12 @@ class AcademicCalendar(models.Model):
     - AcademicCalendar contains multiple CalendarEvents
     """
     
-    # FIELD: Semester Name
-    # Name of the academic semester or term
-    # Examples: "Fall 2024", "Spring 2025", "Summer Session", "First Semester"
-    # CharField with 30 characters handles various naming conventions
-    semester = models.CharField(max_length=30)
-    
-    # FIELD: Academic Year
-    # Year or year range for the academic period  
-    # Examples: "2024", "2024-2025", "AY 2024-25"
-    # CharField with 20 characters handles different year formats
-    year = models.CharField(max_length=20)
+    # FIELD: Academic Term
+    # The semester/year this calendar covers, stored once in the Term lookup table
+    # PROTECT keeps a term from being deleted while calendars still use it
+    # related_name='calendars' allows reverse lookup from term
+    # Filters like term__year='2024-2025' compare a small integer key, not text
+    term = models.ForeignKey('Term', on_delete=models.PROTECT, related_name='calendars')
 
     # FIELD: Target Department (Optional)
     # Optional link to specific department for department-specific calendars
@@ -588,12 +1091,15 @@ class AcademicCalendar(models.Model):
 
     # FIELD: Calendar Creator
     # User who created this academic calendar (admin or authorized user)
-    # PROTECT prevents deletion if creator user account is deleted
+    # SET_NULL keeps the calendar when the creator's user account is deleted
+    # null=True, blank=True because of that (creator shows as unknown)
     # related_name='academic_calendars' allows reverse lookup from user
     # Links to Django's User model via settings.AUTH_USER_MODEL
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
-        on_delete=models.PROTECT,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
         related_name='academic_calendars'
     )
 
@@ -625,15 +1131,20 @@ class AcademicCalendar(models.Model):
 
     # FIELD: Creation Timestamp
     # When the calendar was first created
-    # auto_now_add=True sets this once and never changes
+    # db_default=Now() lets the database fill it on INSERT, so save() and
+    # bulk_create() skip computing it in Python (the value is read back via RETURNING)
     # Useful for tracking calendar creation history
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     
     # FIELD: Last Update Timestamp
     # When the calendar was last modified
-    # auto_now=True updates this every time the record is saved
+    # Set by the database: db_default=Now() on INSERT and a trigger on every UPDATE
+    # (migration 0026), so QuerySet.update() and bulk_update() bump it too
     # Useful for tracking recent calendar changes
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    # MANAGER: Default manager with the AcademicCalendarQuerySet helpers
+    objects = AcademicCalendarQuerySet.as_manager()
 
     class Meta:
         """
@@ -644,13 +1155,24 @@ class AcademicCalendar(models.Model):
         - Provides cleaner, shorter table name
         - Consistent with database naming conventions
         
-        ordering: Default sort order for calendar queries
-        - ['-created_at'] sorts by creation date with newest first
-        - Helpful for displaying recent calendars first
-        - Ensures consistent ordering in admin interface
+        ordering: No default sort order
+        - Visibility checks (calendar__in subqueries, truthiness tests) skip ORDER BY
+        - The calendar list view and the admin order by '-created_at' explicitly
+        
+        indexes: Database performance optimization
+        - Index on ('department', 'shared_with_students'): serves the admin
+          department/sharing filters and the student visibility lookups
+        - Index on ('institution', 'term'): finding an
+          institution's calendar for a given term
+        - Index on ('created_by', 'created_at'): a user's own calendars,
+          newest first, and the SET_NULL update when that user is deleted
         """
         db_table = 'academic_calendar'
-        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['department', 'shared_with_students']),
+            models.Index(fields=['institution', 'term']),
+            models.Index(fields=['created_by', 'created_at']),
+        ]
 
     def __str__(self):
         """
@@ -664,8 +1186,103 @@ class AcademicCalendar(models.Model):
         - "Summer Session (2024)"
         
         Clear identification for admin interface and dropdowns.
+        Lists of calendars should select_related('term') to avoid a query per row.
         """
-        return f"{self.semester} ({self.year})"
+        return str(self.term)
+
+
+# ================================================================================
+# EVENT TYPE COLOR CACHE
+# ================================================================================
+# Calendar pages and CalendarEventForm resolve the event type → color mapping
+# several times per request, and each resolution used to re-read EventTypeColor.
+# The mapping is now memoized per process and keyed on a version stamp kept in
+# Django's cache. Saving or deleting an EventTypeColor replaces the stamp (see
+# academics/signals.py), so every process reloads the overrides on next use.
+# The stamp also expires after a short TTL, which bounds staleness for writes
+# that bypass signals (queryset.update(), other processes on a local cache).
+# ================================================================================
+
+# Cache key holding the current EventTypeColor version stamp
+TYPE_COLOR_VERSION_CACHE_KEY = 'academics:event_type_colors:version'
+
+# Seconds a version stamp lives before the mapping is re-read from the database
+TYPE_COLOR_VERSION_TIMEOUT = 60
+
+
+def _type_color_version():
+    """
+    Returns the current EventTypeColor version stamp, creating one if the
+    cache has none yet (first use, expiry or eviction).
+    """
+    return cache.get_or_set(TYPE_COLOR_VERSION_CACHE_KEY, time.time_ns, TYPE_COLOR_VERSION_TIMEOUT)
+
+
+def invalidate_type_color_mapping():
+    """
+    Replaces the version stamp so cached mappings are rebuilt on next access.
+    Called from the EventTypeColor post_save/post_delete signal handlers.
+    """
+    cache.set(TYPE_COLOR_VERSION_CACHE_KEY, time.time_ns(), TYPE_COLOR_VERSION_TIMEOUT)
+    # drop this process's copy right away; other processes follow the new stamp
+    _load_type_color_mapping.cache_clear()
+
+
+@lru_cache(maxsize=1)
+def _load_type_color_mapping(version):
+    """
+    Builds the mapping from defaults plus EventTypeColor overrides.
+    `version` only keys the memo. Database errors propagate so that a failed
+    lookup (e.g. during migrations) is never cached.
+    The result is shared by every caller, so it is returned read-only.
+    """
+    # values_list: the two columns as tuples, no EventTypeColor instances built
+    overrides = EventTypeColor.objects.values_list('event_type', 'color_code')
+    return MappingProxyType({**CalendarEvent.DEFAULT_TYPE_COLORS, **dict(overrides)})
+
+
+# EVENT TYPES: Predefined categories for academic events
+# These represent different kinds of activities in academic calendar
+# Module-level so CalendarEvent.Meta constraints can reference the values
+# TextChoices members are plain strings, so they work as dict keys
+class EventType(models.TextChoices):
+    REGULAR_TEACHING = 'Regular Teaching', 'Regular Teaching'                       # Normal class sessions
+    TEST = 'Test', 'Test'                                                           # Exams and assessments
+    READING_HOLIDAY = 'Reading Holiday', 'Reading Holiday'                          # Study periods (no classes)
+    PUBLIC_HOLIDAY = 'Public Holiday', 'Public Holiday'                             # Government holidays
+    SEMESTER_BREAK = 'Semester Break', 'Semester Break'                             # Vacation periods
+    FESTIVAL_HOLIDAY = 'Festival Holiday', 'Festival Holiday'                       # Cultural/religious holidays
+    PROJECT_EVALUATION = 'Project / Practical Evaluation', 'Project / Practical Evaluation'  # Lab/project work
+
+
+class CalendarEventQuerySet(models.QuerySet):
+    """
+    CUSTOM QUERYSET: CalendarEvent queries with their common relations pre-loaded
+    """
+
+    def with_related(self):
+        """Joins the parent calendar and its department for event lists spanning calendars."""
+        return self.select_related('calendar__department')
+
+    def for_institution(self, institution):
+        """Events on calendars owned by `institution`: the ownership check of the event views."""
+        return self.filter(calendar__institution=institution)
+
+    def lite(self):
+        """
+        Loads only the columns the calendar month grid reads (title, type, color and
+        the date range fields EventOccurrence expands), skipping description and timestamps.
+        """
+        return self.only('id', 'calendar_id', 'date', 'end_date', 'recurrence', 'title', 'type', 'color_code')
+
+    def for_cards(self):
+        """
+        The lite() columns plus description, for the dashboard event cards that show a
+        short excerpt of it. The created/updated timestamps are still left out.
+        """
+        return self.only(
+            'id', 'calendar_id', 'date', 'end_date', 'recurrence', 'title', 'type', 'color_code', 'description'
+        )
 
 
 class CalendarEvent(models.Model):
@@ -696,28 +1313,26 @@ class CalendarEvent(models.Model):
     - Default colors provided but customizable via EventTypeColor model
     - Supports calendar UI and student/teacher dashboards
     
+    MULTI-DAY EVENTS:
+    A single row can cover a date range instead of one row per day:
+    - date is the first day, end_date the last day (inclusive, optional)
+    - recurrence decides which days in that range the event occurs on
+    - occurrences() expands the row into concrete dates when rendering
+    
     RELATIONSHIPS:
     - CalendarEvent belongs to one AcademicCalendar (required)
     - Multiple CalendarEvents per AcademicCalendar
     - EventTypeColor model can override default colors
     """
     
-    # EVENT TYPE CHOICES: Predefined categories for academic events
-    # These represent different kinds of activities in academic calendar
-    EVENT_TYPES = [
-        ('Regular Teaching', 'Regular Teaching'),          # Normal class sessions
-        ('Test', 'Test'),                                 # Exams and assessments
-        ('Reading Holiday', 'Reading Holiday'),           # Study periods (no classes)
-        ('Public Holiday', 'Public Holiday'),             # Government holidays
-        ('Semester Break', 'Semester Break'),             # Vacation periods
-        ('Festival Holiday', 'Festival Holiday'),         # Cultural/religious holidays
-        ('Project / Practical Evaluation', 'Project / Practical Evaluation'), # Lab/project work
-    ]
+    # EVENT TYPE CHOICES: (value, label) pairs kept for forms and EventTypeColor
+    EVENT_TYPES = EventType.choices
 
     # DEFAULT COLOR PALETTE: Built-in colors for each event type
     # These colors are used if no custom colors are set in EventTypeColor model
     # Colors use hex format for web compatibility (#RRGGBB)
-    DEFAULT_TYPE_COLORS = {
+    # Read-only proxy: shared by every request, and resolved_colors() hands it out directly
+    DEFAULT_TYPE_COLORS = MappingProxyType({
         'Regular Teaching': '#3B82F6',                    # Blue - calm, productive
         'Test': '#EF4444',                               # Red - attention, important
         'Reading Holiday': '#F59E0B',                    # Amber - caution, preparation
@@ -725,7 +1340,15 @@ class CalendarEvent(models.Model):
         'Semester Break': '#64748B',                     # Gray - neutral, break
         'Festival Holiday': '#F97316',                   # Orange - festive, cultural
         'Project / Practical Evaluation': '#6366F1',     # Indigo - focus, assessment
-    }
+    })
+
+    # RECURRENCE CHOICES: How a multi-day event repeats between date and end_date
+    RECUR_DAILY = 'daily'
+    RECUR_WEEKLY = 'weekly'
+    RECURRENCE_CHOICES = [
+        (RECUR_DAILY, 'Every day'),                       # Every date in the range
+        (RECUR_WEEKLY, 'Every week'),                     # Same weekday as the start date
+    ]
 
     # FIELD: Parent Calendar
     # ForeignKey links event to its academic calendar container
@@ -739,11 +1362,22 @@ class CalendarEvent(models.Model):
     )
     
     # FIELD: Event Date
-    # The specific date when this event occurs
+    # The specific date when this event occurs (first day for multi-day events)
     # DateField for calendar integration and date-based queries
     # Required field - every event must have a specific date
     date = models.DateField()
     
+    # FIELD: Event End Date
+    # Last date (inclusive) of a multi-day event
+    # null means a single-day event on `date`
+    # Stored on one row instead of creating one row per day
+    end_date = models.DateField(null=True, blank=True)
+    
+    # FIELD: Recurrence Rule
+    # Which days between date and end_date the event occurs on
+    # Ignored for single-day events (end_date is null)
+    recurrence = models.CharField(max_length=10, choices=RECURRENCE_CHOICES, default=RECUR_DAILY)
+    
     # FIELD: Event Title
     # Short descriptive name for the event
     # Examples: "Final Exams Begin", "Independence Day", "Spring Break Starts"
@@ -773,15 +1407,20 @@ class CalendarEvent(models.Model):
     
     # FIELD: Creation Timestamp
     # When the event was first created
-    # auto_now_add=True sets this once and never changes
+    # db_default=Now() lets the database fill it on INSERT, so save() and
+    # bulk_create() skip computing it in Python (the value is read back via RETURNING)
     # Useful for tracking event creation history
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     
     # FIELD: Last Update Timestamp
     # When the event was last modified
-    # auto_now=True updates this every time the record is saved
+    # Set by the database: db_default=Now() on INSERT and a trigger on every UPDATE
+    # (migration 0026), so QuerySet.update() and bulk_update() bump it too
     # Useful for tracking recent event changes
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
+
+    # MANAGER: Default manager with the CalendarEventQuerySet helpers
+    objects = CalendarEventQuerySet.as_manager()
 
     class Meta:
         """
@@ -796,9 +1435,41 @@ class CalendarEvent(models.Model):
         - ['date', 'id'] sorts by event date first, then by ID
         - Ensures chronological ordering for calendar display
         - ID as secondary sort handles multiple events on same date
+        
+        indexes: Database performance optimization
+        - ('calendar', 'date') lookups (month views, admin calendar filter) use
+          the unique constraint's index below, so there is no separate index
+        - Index on 'type': admin event type filter
+        - Index on 'date': upcoming-event lookups on the dashboards, which
+          span every shared calendar rather than a single one
+        
+        constraints: Database-level data integrity
+        - end_date, when set, must not be earlier than date
+        - type must be one of the EventType values
+        - One event per (calendar, date, title): adding the same event twice
+          leaves the existing row as it is (see calendar_event_create)
+          Its (calendar, date, ...) prefix also serves the calendar month view's
+          range scan (calendar_id = ? AND date <= ?), so no separate
+          (calendar, date) index is kept
         """
         db_table = 'calendar_events'
         ordering = ['date', 'id']
+        indexes = [
+            models.Index(fields=['type']),
+            models.Index(fields=['date']),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(end_date__isnull=True) | models.Q(end_date__gte=models.F('date')),
+                name='calendar_event_end_date_gte_date',
+                violation_error_message='End date cannot be earlier than the start date.',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(type__in=EventType.values),
+                name='calendar_event_type_valid',
+            ),
+            models.UniqueConstraint(fields=['calendar', 'date', 'title'], name='calendar_event_unique_day_title'),
+        ]
 
     def __str__(self):
         """
@@ -815,6 +1486,64 @@ class CalendarEvent(models.Model):
         """
         return f"{self.date} - {self.title}"
 
+    @classmethod
+    def overlapping_q(cls, start, end):
+        """
+        Q filter matching events with at least one day inside [start, end].
+        
+        USAGE:
+        CalendarEvent.objects.filter(CalendarEvent.overlapping_q(first_day, last_day))
+        """
+        return models.Q(date__lte=end) & (
+            models.Q(end_date__gte=start) | models.Q(end_date__isnull=True, date__gte=start)
+        )
+
+    @classmethod
+    def upcoming_q(cls, today):
+        """Q filter matching events with an occurrence on or after `today`."""
+        return models.Q(date__gte=today) | models.Q(end_date__gte=today)
+
+    def occurrences(self, start, end):
+        """
+        Yields the dates this event occurs on within [start, end] (inclusive).
+        
+        EXAMPLES:
+        - Single-day event on 2025-01-10 → 2025-01-10 only
+        - Daily 2025-01-10 → 2025-01-14 → five consecutive dates
+        - Weekly 2025-01-06 → 2025-01-31 → every Monday in that range
+        """
+        step = 7 if self.recurrence == self.RECUR_WEEKLY else 1
+        current = self.date
+        if start > current:
+            # jump straight to the first occurrence on or after `start`
+            current += timedelta(days=-(-(start - current).days // step) * step)
+        last = min(self.end_date or self.date, end)
+        while current <= last:
+            yield current
+            current += timedelta(days=step)
+
+    def next_occurrence(self, on_or_after):
+        """Returns the first occurrence date on or after the given date, or None."""
+        return next(self.occurrences(on_or_after, self.end_date or self.date), None)
+
+    @classmethod
+    def resolved_colors(cls):
+        """
+        CLASS METHOD: Shared, read-only event type to color mapping
+        
+        Same content as get_type_color_mapping() but without copying the
+        dict, for hot paths that only look colors up. Falls back to the
+        built-in defaults when the overrides table cannot be read.
+        
+        USAGE:
+        CalendarEvent.resolved_colors()[event.type]
+        """
+        try:
+            return _load_type_color_mapping(_type_color_version())
+        except Exception:
+            # Migrations / database unavailable → static defaults (already read-only)
+            return cls.DEFAULT_TYPE_COLORS
+
     @classmethod
     def get_type_color_mapping(cls):
         """
@@ -829,8 +1558,13 @@ class CalendarEvent(models.Model):
         2. Override with any colors set in EventTypeColor model (admin customizations)
         3. Return complete mapping for all event types
         
+        CACHING:
+        - The mapping is memoized per process (see _load_type_color_mapping)
+        - Only the first call after an EventTypeColor change hits the database
+        - A fresh dict is returned so callers may modify it safely
+        
         ERROR HANDLING:
-        - Uses try/except to handle database access errors
+        - Database access errors are handled by resolved_colors()
         - Safe to call during migrations when tables might not exist yet
         - Falls back to default colors if database access fails
         - Ensures method always returns usable color mapping
@@ -850,24 +1584,13 @@ class CalendarEvent(models.Model):
             ...
         }
         """
-        # Start with built-in default colors as base mapping
-        mapping = dict(cls.DEFAULT_TYPE_COLORS)
-        
-        try:
-            # Try to get custom color overrides from database
-            # EventTypeColor may not exist during migrations, so guard with try/except
-            for override in EventTypeColor.objects.all():
-                # Override default color with admin-configured color
-                mapping[override.event_type] = override.color_code
-        except Exception:
-            # Any database access error → return static defaults
-            # This handles migration scenarios and database connectivity issues
-            pass
-        
-        return mapping
+        # Copy the memoized mapping for the current override version
+        # resolved_colors() already falls back to defaults on database errors
+        # (e.g. during migrations when EventTypeColor may not exist yet)
+        return dict(cls.resolved_colors())
 
     @classmethod
-    def color_for_type(cls, ev_type):
+    def color_for_type(cls, ev_type, mapping=None):
         """
         CLASS METHOD: Get color for a specific event type
         
@@ -882,6 +1605,8 @@ class CalendarEvent(models.Model):
         
         PARAMETERS:
         ev_type (str): Event type name (e.g., 'Test', 'Public Holiday')
+        mapping (Mapping, optional): Result of resolved_colors() fetched once by
+            a caller that colors many events in a loop; skips the version lookup
         
         RETURNS:
         str: Hex color code (e.g., '#EF4444')
@@ -893,14 +1618,47 @@ class CalendarEvent(models.Model):
         TEMPLATE USAGE:
         Can be used in templates for dynamic color assignment
         """
-        # Get complete type-to-color mapping (includes overrides)
-        complete_mapping = cls.get_type_color_mapping()
+        # Get complete type-to-color mapping (includes overrides), no copy needed for a lookup
+        complete_mapping = cls.resolved_colors() if mapping is None else mapping
         
-        # Try to find color in complete mapping, fall back to default, then final fallback
-        return complete_mapping.get(
-            ev_type,                                    # Try complete mapping first
-            cls.DEFAULT_TYPE_COLORS.get(ev_type, '#2563EB')  # Fall back to default, then blue
-        )
+        # Known types are answered by the single lookup; the default/blue fallback is
+        # only evaluated for types missing from the mapping
+        return complete_mapping.get(ev_type) or cls.DEFAULT_TYPE_COLORS.get(ev_type, '#2563EB')
+
+
+class EventOccurrence:
+    """
+    One dated occurrence of a (possibly multi-day) CalendarEvent.
+    
+    Templates read it like the event itself (id, title, type, color_code, ...),
+    with `date` set to the occurrence date instead of the event's start date.
+    """
+    __slots__ = ('event', 'date')
+
+    def __init__(self, event, date):
+        self.event = event
+        self.date = date
+
+    def __getattr__(self, name):
+        return getattr(self.event, name)
+
+    @classmethod
+    def expand(cls, events, start, end):
+        """Expands events into occurrences within [start, end], sorted by (date, id)."""
+        occurrences = [cls(event, day) for event in events for day in event.occurrences(start, end)]
+        occurrences.sort(key=lambda occ: (occ.date, occ.event.id))
+        return occurrences
+
+    @classmethod
+    def upcoming(cls, events, today, limit):
+        """Next occurrence of each event on or after `today`, earliest first, at most `limit`."""
+        occurrences = []
+        for event in events:
+            day = event.next_occurrence(today)
+            if day:
+                occurrences.append(cls(event, day))
+        occurrences.sort(key=lambda occ: (occ.date, occ.event.id))
+        return occurrences[:limit]
 
 
 class EventTypeColor(models.Model):
@@ -951,9 +1709,10 @@ class EventTypeColor(models.Model):
     
     # FIELD: Last Update Timestamp
     # When this color override was last modified
-    # auto_now=True updates this every time the record is saved
+    # Set by the database: db_default=Now() on INSERT and a trigger on every UPDATE
+    # (migration 0026), so QuerySet.update() and bulk_update() bump it too
     # Useful for tracking color scheme changes and updates
-    updated_at = models.DateTimeField(auto_now=True)
+    updated_at = models.DateTimeField(db_default=Now(), editable=False)
 
     class Meta:
         """
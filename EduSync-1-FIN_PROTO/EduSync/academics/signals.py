@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from institution.models import Department
+from .models import (
+    Attendance, AttendanceSheet, CalendarEvent, Course, EventTypeColor,
+    invalidate_attendance_summaries, invalidate_course_rows, invalidate_sheet_summaries,
+    invalidate_type_color_mapping,
+)
+
+
+@receiver(post_save, sender=EventTypeColor)
+@receiver(post_delete, sender=EventTypeColor)
+def event_type_color_changed(sender, **kwargs):
+    """Drop the cached event type → color mapping whenever an override changes."""
+    invalidate_type_color_mapping()
+
+
+@receiver(pre_save, sender=EventTypeColor)
+def remember_previous_type_color(sender, instance, **kwargs):
+    """Record the type/color in effect before this save so post_save can repaint matching events."""
+    previous = None
+    if instance.pk:
+        previous = EventTypeColor.objects.filter(pk=instance.pk).values_list('event_type', 'color_code').first()
+    if previous is None:
+        previous = (instance.event_type, CalendarEvent.DEFAULT_TYPE_COLORS.get(instance.event_type))
+    instance._previous_type_color = previous
+
+
+@receiver(post_save, sender=EventTypeColor)
+def repaint_events_for_type_color(sender, instance, **kwargs):
+    """
+    Push the new color onto stored events that still carry the type's previous color,
+    so CalendarEvent.color_code stays authoritative for readers. Custom picks are left alone.
+    """
+    ev_type, old_color = getattr(instance, '_previous_type_color', (instance.event_type, None))
+    if old_color and ev_type == instance.event_type and old_color != instance.color_code:
+        CalendarEvent.objects.filter(type=ev_type, color_code__iexact=old_color).update(color_code=instance.color_code)
+
+
+@receiver(post_delete, sender=EventTypeColor)
+def reset_events_for_deleted_type_color(sender, instance, **kwargs):
+    """Return events painted with a removed override to the built-in default color."""
+    default = CalendarEvent.DEFAULT_TYPE_COLORS.get(instance.event_type)
+    if default:
+        CalendarEvent.objects.filter(
+            type=instance.event_type, color_code__iexact=instance.color_code
+        ).update(color_code=default)
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def department_changed(sender, instance, **kwargs):
+    """Drop the cached department choices of the institution the department belongs to."""
+    # imported here so app loading (ready()) does not pull in the forms module
+    from .forms import DEPARTMENT_CHOICES_CACHE_KEY
+    cache.delete(DEPARTMENT_CHOICES_CACHE_KEY.format(instance.institution_id))
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def course_changed(sender, instance, **kwargs):
+    """Drop the cached course list rows of the course's institution."""
+    invalidate_course_rows(instance.institution_id)
+
+
+@receiver(post_save, sender=Attendance)
+@receiver(post_delete, sender=Attendance)
+def attendance_changed(sender, instance, **kwargs):
+    """Drop the cached attendance totals of the record's student and sheet."""
+    invalidate_attendance_summaries([instance.student_id])
+    invalidate_sheet_summaries([instance.sheet_id])
+
+
+@receiver(post_save, sender=AttendanceSheet)
+def attendance_sheet_changed(sender, instance, **kwargs):
+    """A sheet's lecture total or sharing flag feeds the totals of every student on it."""
+    invalidate_attendance_summaries(instance.attendance_records.values_list('student_id', flat=True))
+    invalidate_sheet_summaries([instance.pk])
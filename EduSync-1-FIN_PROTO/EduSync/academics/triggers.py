@@ -0,0 +1,79 @@
+"""
+Database triggers that keep `updated_at` current on every UPDATE.
+
+The academics models declare `updated_at` with db_default=Now(), so INSERTs are
+stamped by the database. These triggers stamp UPDATEs the same way, including
+QuerySet.update() and bulk_update(), which never ran auto_now.
+
+SQLite drops a table's triggers whenever a migration rebuilds that table, so the
+triggers are (re)installed after every migrate run as well as in migration 0026.
+All statements are idempotent.
+"""
+
+# Tables whose `updated_at` column is maintained by the database
+UPDATED_AT_TABLES = (
+    'academics_attendancesheet',
+    'academic_calendar',
+    'calendar_events',
+    'event_type_colors',
+)
+
+_PG_FUNCTION = """
+CREATE OR REPLACE FUNCTION academics_set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := now();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# DROP + CREATE rather than CREATE OR REPLACE TRIGGER, which needs PostgreSQL 14
+_PG_TRIGGER = (
+    'DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}; '
+    'CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} '
+    'FOR EACH ROW EXECUTE FUNCTION academics_set_updated_at()'
+)
+
+# SQLite has no BEFORE-UPDATE row assignment; re-stamp the row after the update instead.
+# Recursive triggers are off by default, so the inner UPDATE does not fire it again.
+_SQLITE_TRIGGER = (
+    'CREATE TRIGGER IF NOT EXISTS {table}_set_updated_at AFTER UPDATE ON {table} '
+    'FOR EACH ROW BEGIN '
+    "UPDATE {table} SET updated_at = STRFTIME('%Y-%m-%d %H:%M:%f', 'NOW') WHERE id = NEW.id; "
+    'END'
+)
+
+
+def install_updated_at_triggers(connection):
+    """Create the updated_at triggers on the tables that currently exist."""
+    if connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    existing = set(connection.introspection.table_names())
+    tables = [table for table in UPDATED_AT_TABLES if table in existing]
+    if not tables:
+        return
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(_PG_FUNCTION)
+            template = _PG_TRIGGER
+        else:
+            template = _SQLITE_TRIGGER
+        for table in tables:
+            cursor.execute(template.format(table=table))
+
+
+def drop_updated_at_triggers(connection):
+    """Remove the updated_at triggers (and the PostgreSQL trigger function)."""
+    if connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    existing = set(connection.introspection.table_names())
+    with connection.cursor() as cursor:
+        for table in UPDATED_AT_TABLES:
+            if table not in existing:
+                continue
+            if connection.vendor == 'postgresql':
+                cursor.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}')
+            else:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {table}_set_updated_at')
+        if connection.vendor == 'postgresql':
+            cursor.execute('DROP FUNCTION IF EXISTS academics_set_updated_at()')
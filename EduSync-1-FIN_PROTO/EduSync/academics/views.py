@@ -1,4 +1,5 @@
-from datetime import date, timedelta
+from datetime import date
+from functools import lru_cache
 import calendar as py_calendar
 
 from django.shortcuts import render, redirect, get_object_or_404
@@ -6,23 +7,15 @@ from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.views.decorators.http import require_POST
 from django.db import IntegrityError
-from django.db.models import Q
-from .models import Course, Grade, AcademicCalendar, CalendarEvent
+from django.db.models import F, Q
+from .models import Course, Grade, AcademicCalendar, CalendarEvent, EventOccurrence
 from .forms import CourseForm, AcademicCalendarForm, CalendarEventForm
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import ensure_csrf_cookie, csrf_protect
 from institution.models import Institution
 
 from accounts.decorators import role_required
-from accounts.utils import get_user_institution
-
-
-def _get_user_role(user):
-    """Get user role from UserProfile"""
-    try:
-        return user.userprofile.role
-    except Exception:
-        return None
+from accounts.utils import get_user_institution, get_user_role as _get_user_role
 
 
 def _is_admin(user):
@@ -37,15 +30,24 @@ def _is_student(user):
     return _get_user_role(user) == 'student'
 
 
+_MONTH_CALENDAR = py_calendar.Calendar(firstweekday=0)
+
+
+@lru_cache(maxsize=512)
+def _month_weeks(year, month):
+    """Week rows of day numbers (0 = outside the month); tuples so the cached grid can't be mutated."""
+    return tuple(tuple(week) for week in _MONTH_CALENDAR.monthdayscalendar(year, month))
+
+
 @ensure_csrf_cookie
 @csrf_protect
 @login_required(login_url='login')
 def course_list(request):
     institution = get_user_institution(request.user)
     if institution:
-        courses = Course.objects.filter(institution=institution)
+        courses = Course.objects.cached_rows(institution.id)
     else:
-        courses = Course.objects.all()
+        courses = list(Course.objects.list_rows())
     context = {'courses': courses, 'institution': institution, 'is_admin': _is_admin(request.user)}
     return render(request, 'academics/course_list.html', context)
 
@@ -57,7 +59,7 @@ def course_detail(request, course_id):
         course = get_object_or_404(Course, id=course_id, institution=institution)
     else:
         course = get_object_or_404(Course, id=course_id)
-    grades = Grade.objects.filter(course=course)
+    grades = list(Grade.objects.filter(course=course).with_related())
     context = {'course': course, 'grades': grades, 'is_admin': _is_admin(request.user)}
     return render(request, 'academics/course_detail.html', context)
 
@@ -140,39 +142,34 @@ def academic_calendar_list(request):
     if not user_institution:
         return render(request, 'academics/calendar_list.html', {'calendars': AcademicCalendar.objects.none(), 'is_admin': False})
 
-    # Filter calendars to only show those belonging to the current user's institution
-    base_qs = AcademicCalendar.objects.filter(institution=user_institution).select_related('created_by', 'department')
-    
-    # Also handle the role-based visibility within the institution
-    if _is_admin(request.user):
-        calendars = base_qs.all()
-    elif _is_teacher(request.user):
-        teacher_dept = getattr(getattr(request.user, 'teacher', None), 'department', None)
-        calendars = base_qs.filter(shared_with_teachers=True)
-        if teacher_dept:
-            calendars = calendars.filter(Q(department__isnull=True) | Q(department=teacher_dept))
-        else:
-            calendars = calendars.filter(department__isnull=True)
-    elif _is_student(request.user):
-        student_dept = getattr(getattr(request.user, 'student', None), 'department', None)
-        calendars = base_qs.filter(shared_with_students=True)
-        if student_dept:
-            calendars = calendars.filter(Q(department__isnull=True) | Q(department=student_dept))
-        else:
-            calendars = calendars.filter(department__isnull=True)
-    else:
+    # Build one visibility filter for the user's role and evaluate it in a single query
+    role = _get_user_role(request.user)
+    visible = Q(institution=user_institution)
+    if role in ('teacher', 'student'):
+        # teachers/students see shared calendars that are institution-wide or for their department
+        profile = getattr(request.user, role, None)
+        dept_id = getattr(profile, 'department_id', None)
+        visible &= Q(shared_with_teachers=True) if role == 'teacher' else Q(shared_with_students=True)
+        visible &= (Q(department__isnull=True) | Q(department_id=dept_id)) if dept_id else Q(department__isnull=True)
+    elif role != 'institution_admin':
+        visible = None
+
+    if visible is None:
         calendars = AcademicCalendar.objects.none()
+    else:
+        # only the columns the calendar cards render
+        calendars = AcademicCalendar.objects.filter(visible).select_related('term', 'created_by', 'department').only(
+            'id', 'created_at', 'shared_with_students', 'shared_with_teachers',
+            'term__name', 'term__year', 'created_by__username', 'department__name',
+        )
 
     # Determine dashboard URL for the back button
-    dashboard_url = 'institution_admin_dashboard'
-    if _is_teacher(request.user):
-        dashboard_url = 'teacher_dashboard'
-    elif _is_student(request.user):
-        dashboard_url = 'student_dashboard'
+    dashboard_url = {'teacher': 'teacher_dashboard', 'student': 'student_dashboard'}.get(role, 'institution_admin_dashboard')
 
     return render(request, 'academics/calendar_list.html', {
-        'calendars': calendars, 
-        'is_admin': _is_admin(request.user),
+        # evaluated here so the template's {% if %}/{% for %} can never issue a second query
+        'calendars': list(calendars.order_by('-created_at')), 
+        'is_admin': role == 'institution_admin',
         'dashboard_url': dashboard_url
     })
 
@@ -181,7 +178,7 @@ def academic_calendar_list(request):
 def academic_calendar_detail(request, calendar_id):
     user_institution = get_user_institution(request.user)
     calendar_obj = get_object_or_404(
-        AcademicCalendar.objects.filter(institution=user_institution).select_related('created_by', 'department'), 
+        AcademicCalendar.objects.for_institution(user_institution).select_related('term', 'created_by', 'department'), 
         id=calendar_id
     )
 
@@ -223,11 +220,18 @@ def academic_calendar_detail(request, calendar_id):
         next_month, next_year = month + 1, year
 
     month_name = py_calendar.month_name[month]
-    month_weeks = py_calendar.Calendar(firstweekday=0).monthdayscalendar(year, month)
-
-    events_qs = CalendarEvent.objects.filter(calendar=calendar_obj, date__year=year, date__month=month).order_by('date', 'id')
+    month_weeks = _month_weeks(year, month)
+
+    # multi-day events are stored once; expand the ones touching this month into per-day occurrences.
+    # One query feeds the grid, the side list and the JSON payload; every occurrence is inside the month.
+    first_day = date(year, month, 1)
+    last_day = date(year, month, py_calendar.monthrange(year, month)[1])
+    events_qs = CalendarEvent.objects.filter(
+        CalendarEvent.overlapping_q(first_day, last_day), calendar=calendar_obj
+    ).lite().order_by('date', 'id')
+    month_events = EventOccurrence.expand(events_qs, first_day, last_day)
     events_by_day = {}
-    for event in events_qs:
+    for event in month_events:
         events_by_day.setdefault(event.date.day, []).append(event)
 
     context = {
@@ -237,13 +241,13 @@ def academic_calendar_detail(request, calendar_id):
         'month_name': month_name,
         'month_weeks': month_weeks,
         'events_by_day': events_by_day,
-        'events': calendar_obj.events.all().order_by('date', 'id'),
+        'events': month_events,
         'is_admin': _is_admin(request.user),
         'prev_month': prev_month,
         'prev_year': prev_year,
         'next_month': next_month,
         'next_year': next_year,
-        'type_colors': CalendarEvent.get_type_color_mapping(),
+        'type_colors': CalendarEvent.resolved_colors(),
     }
     return render(request, 'academics/calendar_detail.html', context)
 
@@ -258,27 +262,25 @@ def academic_calendar_share(request, calendar_id):
     - 'all' toggles both flags together (useful for the single "Share" button)
     """
     user_institution = get_user_institution(request.user)
-    calendar_obj = get_object_or_404(AcademicCalendar.objects.filter(institution=user_institution), id=calendar_id)
+    calendar_obj = get_object_or_404(
+        AcademicCalendar.objects.for_institution(user_institution).only('id', 'shared_with_students', 'shared_with_teachers'),
+        id=calendar_id,
+    )
     if request.method == 'POST':
         target = request.POST.get('target')
+        # each toggle is one UPDATE of just the flag columns; ~F() flips the stored value in SQL
+        calendar_row = AcademicCalendar.objects.filter(pk=calendar_obj.pk)
         if target == 'students':
-            calendar_obj.shared_with_students = not calendar_obj.shared_with_students
-            calendar_obj.save()
-            messages.success(request, f"Shared with students: {calendar_obj.shared_with_students}")
+            calendar_row.update(shared_with_students=~F('shared_with_students'))
+            messages.success(request, f"Shared with students: {not calendar_obj.shared_with_students}")
         elif target == 'teachers':
-            calendar_obj.shared_with_teachers = not calendar_obj.shared_with_teachers
-            calendar_obj.save()
-            messages.success(request, f"Shared with teachers: {calendar_obj.shared_with_teachers}")
+            calendar_row.update(shared_with_teachers=~F('shared_with_teachers'))
+            messages.success(request, f"Shared with teachers: {not calendar_obj.shared_with_teachers}")
         elif target == 'all':
             # if either flag is false, set both true; otherwise unset both
-            if not (calendar_obj.shared_with_students and calendar_obj.shared_with_teachers):
-                calendar_obj.shared_with_students = True
-                calendar_obj.shared_with_teachers = True
-            else:
-                calendar_obj.shared_with_students = False
-                calendar_obj.shared_with_teachers = False
-            calendar_obj.save()
-            messages.success(request, f"Shared with students and teachers: {calendar_obj.shared_with_students and calendar_obj.shared_with_teachers}")
+            share = not (calendar_obj.shared_with_students and calendar_obj.shared_with_teachers)
+            calendar_row.update(shared_with_students=share, shared_with_teachers=share)
+            messages.success(request, f"Shared with students and teachers: {share}")
     return redirect('academic_calendar_detail', calendar_id=calendar_obj.id)
 
 
@@ -308,7 +310,8 @@ def academic_calendar_create(request):
 @role_required('institution_admin')
 def academic_calendar_edit(request, calendar_id):
     user_institution = get_user_institution(request.user)
-    calendar_obj = get_object_or_404(AcademicCalendar.objects.filter(institution=user_institution), id=calendar_id)
+    # the form shows the term's semester/year, so join it
+    calendar_obj = get_object_or_404(AcademicCalendar.objects.for_institution(user_institution).select_related('term'), id=calendar_id)
     institution = user_institution
 
     if request.method == 'POST':
@@ -332,7 +335,7 @@ def academic_calendar_edit(request, calendar_id):
 @require_POST
 def academic_calendar_delete(request, calendar_id):
     user_institution = get_user_institution(request.user)
-    calendar_obj = get_object_or_404(AcademicCalendar.objects.filter(institution=user_institution), id=calendar_id)
+    calendar_obj = get_object_or_404(AcademicCalendar.objects.for_institution(user_institution).only('id'), id=calendar_id)
     calendar_obj.delete()
     messages.success(request, 'Academic calendar deleted successfully.')
     return redirect('academic_calendar_list')
@@ -342,7 +345,8 @@ def academic_calendar_delete(request, calendar_id):
 @role_required('institution_admin')
 def calendar_event_create(request, calendar_id):
     user_institution = get_user_institution(request.user)
-    calendar_obj = get_object_or_404(AcademicCalendar.objects.filter(institution=user_institution), id=calendar_id)
+    # only the id is used (new event's FK, redirects)
+    calendar_obj = get_object_or_404(AcademicCalendar.objects.for_institution(user_institution).only('id'), id=calendar_id)
 
     if request.method == 'POST':
         form = CalendarEventForm(request.POST)
@@ -353,27 +357,23 @@ def calendar_event_create(request, calendar_id):
             title = ev_type  # simplified: title is derived from the editable type
             color = form.cleaned_data.get('color_code') or CalendarEvent.color_for_type(ev_type)
 
-            # if end_date provided and >= start_date, create events for each date in the inclusive range
-            dates = [start_date]
-            if end_date and end_date >= start_date:
-                cur = start_date
-                while cur <= end_date:
-                    dates.append(cur)
-                    cur = cur + timedelta(days=1)
-                # remove the duplicate start_date added earlier
-                dates = sorted(set(dates))
-
-            created = 0
-            for d in dates:
-                # avoid duplicate identical events on same calendar/date/title
-                obj, created_flag = CalendarEvent.objects.get_or_create(
-                    calendar=calendar_obj, date=d, title=title,
-                    defaults={'type': ev_type, 'description': '', 'color_code': color}
-                )
-                if created_flag:
-                    created += 1
-
-            messages.success(request, f'Event added successfully ({created} created).')
+            # a date range is stored as one event with an end date; the calendar view expands it per day
+            if end_date == start_date:
+                end_date = None
+
+            # an event already on this calendar/date/title is left as it is
+            _, created = CalendarEvent.objects.get_or_create(
+                calendar=calendar_obj, date=start_date, title=title,
+                defaults={
+                    'end_date': end_date, 'type': ev_type, 'description': '', 'color_code': color,
+                    'recurrence': form.cleaned_data.get('recurrence') or CalendarEvent.RECUR_DAILY,
+                },
+            )
+
+            if created:
+                messages.success(request, 'Event added successfully.')
+            else:
+                messages.warning(request, 'An event of this type already exists on that date; it was left unchanged.')
             return redirect('academic_calendar_detail', calendar_id=calendar_obj.id)
     else:
         # allow pre-filling the date when creating from a month/day cell
@@ -387,7 +387,7 @@ def calendar_event_create(request, calendar_id):
         'form': form,
         'calendar_obj': calendar_obj,
         'mode': 'create',
-        'type_colors': CalendarEvent.get_type_color_mapping(),
+        'type_colors': CalendarEvent.resolved_colors(),
     })
 
 
@@ -395,10 +395,8 @@ def calendar_event_create(request, calendar_id):
 @role_required('institution_admin')
 def calendar_event_edit(request, event_id):
     user_institution = get_user_institution(request.user)
-    event = get_object_or_404(
-        CalendarEvent.objects.filter(calendar__institution=user_institution).select_related('calendar'), 
-        id=event_id
-    )
+    # the calendar is passed to the template; its institution is only checked in the WHERE clause
+    event = get_object_or_404(CalendarEvent.objects.for_institution(user_institution).select_related('calendar'), id=event_id)
 
     if request.method == 'POST':
         form = CalendarEventForm(request.POST, instance=event)
@@ -419,7 +417,7 @@ def calendar_event_edit(request, event_id):
         'calendar_obj': event.calendar,
         'mode': 'edit',
         'event': event,
-        'type_colors': CalendarEvent.get_type_color_mapping(),
+        'type_colors': CalendarEvent.resolved_colors(),
     })
 
 
@@ -428,7 +426,8 @@ def calendar_event_edit(request, event_id):
 @require_POST
 def calendar_event_delete(request, event_id):
     user_institution = get_user_institution(request.user)
-    event = get_object_or_404(CalendarEvent.objects.filter(calendar__institution=user_institution), id=event_id)
+    # only the key and the calendar id (for the redirect) are needed to delete
+    event = get_object_or_404(CalendarEvent.objects.for_institution(user_institution).only('id', 'calendar_id'), id=event_id)
     calendar_id = event.calendar_id
     event.delete()
     messages.success(request, 'Event deleted successfully.')
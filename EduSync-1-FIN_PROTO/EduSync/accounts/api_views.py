@@ -1,11 +1,16 @@
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
 
+from .decorators import jwt_authenticated
 from .serializers import CustomTokenObtainPairSerializer, UserSerializer
 
 
@@ -39,6 +44,10 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     }
     """
     permission_classes = [AllowAny]
+    # Every attempt runs the password hasher; cap attempts per client
+    # (rate in REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'])
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = 'auth_token'
     serializer_class = CustomTokenObtainPairSerializer
 
 
@@ -131,7 +140,8 @@ class UserProfileView(APIView):
         return Response(serializer.data)
 
 
-class VerifyTokenView(APIView):
+@method_decorator(jwt_authenticated, name='dispatch')
+class VerifyTokenView(View):
     """
     Verify if the current access token is valid.
     
@@ -146,11 +156,13 @@ class VerifyTokenView(APIView):
         "user_id": 1,
         "username": "user123"
     }
+
+    Plain Django view: this is the most frequently hit auth endpoint and only
+    echoes the token's user, so it skips DRF's negotiation/renderer pipeline.
     """
-    permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        return Response({
+        return JsonResponse({
             'valid': True,
             'user_id': request.user.id,
             'username': request.user.username
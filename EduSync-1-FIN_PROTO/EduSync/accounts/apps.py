@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class AccountsConfig(AppConfig):
     name = 'accounts'
+
+    def ready(self):
+        # register signal handlers; this only connects receivers and must not query the database
+        from . import signals  # noqa: F401
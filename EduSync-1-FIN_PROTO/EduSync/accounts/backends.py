@@ -0,0 +1,20 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    ModelBackend that loads the user's UserProfile together with the user.
+
+    AuthenticationMiddleware fetches request.user on every request, and almost
+    every view then reads user.userprofile.role; joining the profile here turns
+    those two queries into one.
+    """
+
+    def get_user(self, user_id):
+        UserModel = get_user_model()
+        try:
+            user = UserModel._default_manager.select_related('userprofile').get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -1,67 +1,89 @@
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import redirect
 from django.contrib import messages
+from django.http import JsonResponse
 from functools import wraps
 
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
-def _get_user_role(user):
-    """Get user role from UserProfile"""
-    try:
-        return user.userprofile.role
-    except Exception:
-        return None
+from .utils import get_user_role as _get_user_role
 
 
-def admin_required(view_func):
-    """Decorator to require admin role"""
-    @wraps(view_func)
-    @login_required(login_url='login')
-    def wrapper(request, *args, **kwargs):
-        if _get_user_role(request.user) != 'institution_admin':
-            messages.error(request, 'You do not have permission to access this page.')
-            return redirect('login')
-        return view_func(request, *args, **kwargs)
-    return wrapper
+def _role_gate(allowed_roles, deny):
+    """
+    Builds a decorator that lets through logged-in users whose role is in
+    `allowed_roles` and hands everyone else to `deny(request, role)`.
+    The role is read once per check (and memoized on the user for the request).
+    """
+    allowed_roles = frozenset(allowed_roles)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        @login_required(login_url='login')
+        def wrapper(request, *args, **kwargs):
+            role = _get_user_role(request.user)
+            if role not in allowed_roles:
+                return deny(request, role)
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
 
 
-def teacher_required(view_func):
-    """Decorator to require teacher role"""
-    @wraps(view_func)
-    @login_required(login_url='login')
-    def wrapper(request, *args, **kwargs):
-        if _get_user_role(request.user) != 'teacher':
-            messages.error(request, 'You do not have permission to access this page.')
-            return redirect('login')
-        return view_func(request, *args, **kwargs)
-    return wrapper
+def _deny_to_login(request, role):
+    messages.error(request, 'You do not have permission to access this page.')
+    return redirect('login')
+
+
+def _deny_to_dashboard(request, role):
+    messages.error(request, 'You are not authorized to do that if button is accessed from student and teacher dashbord only admin has rights to change it')
+    if role == 'teacher':
+        return redirect('teacher_dashboard')
+    elif role == 'student':
+        return redirect('student_dashboard')
+    return redirect('login')
 
 
-def student_required(view_func):
-    """Decorator to require student role"""
+# Decorator to require admin role
+admin_required = _role_gate({'institution_admin'}, _deny_to_login)
+
+# Decorator to require teacher role
+teacher_required = _role_gate({'teacher'}, _deny_to_login)
+
+# Decorator to require student role
+student_required = _role_gate({'student'}, _deny_to_login)
+
+
+def role_required(*roles):
+    """Decorator to require specific roles"""
+    return _role_gate(roles, _deny_to_dashboard)
+
+
+def jwt_authenticated(view_func):
+    """
+    Lightweight stand-in for a DRF view with IsAuthenticated, for plain Django
+    views that answer JSON: authenticates the Bearer token once (falling back to
+    the session user, like REST_FRAMEWORK's SessionAuthentication) and sets
+    request.user. Failures get the same 401 bodies DRF would send.
+    """
+    authenticator = JWTAuthentication()
+
     @wraps(view_func)
-    @login_required(login_url='login')
     def wrapper(request, *args, **kwargs):
-        if _get_user_role(request.user) != 'student':
-            messages.error(request, 'You do not have permission to access this page.')
-            return redirect('login')
+        try:
+            result = authenticator.authenticate(request)
+        except AuthenticationFailed as exc:
+            detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+            return _unauthorized(authenticator, request, detail)
+        if result is not None:
+            request.user, request.auth = result
+        elif not request.user.is_authenticated:
+            return _unauthorized(authenticator, request, {'detail': 'Authentication credentials were not provided.'})
         return view_func(request, *args, **kwargs)
     return wrapper
 
 
-def role_required(*roles):
-    """Decorator to require specific roles"""
-    def decorator(view_func):
-        @wraps(view_func)
-        @login_required(login_url='login')
-        def wrapper(request, *args, **kwargs):
-            if _get_user_role(request.user) not in roles:
-                role = _get_user_role(request.user)
-                messages.error(request, 'You are not authorized to do that if button is accessed from student and teacher dashbord only admin has rights to change it')
-                if role == 'teacher':
-                    return redirect('teacher_dashboard')
-                elif role == 'student':
-                    return redirect('student_dashboard')
-                return redirect('login')
-            return view_func(request, *args, **kwargs)
-        return wrapper
-    return decorator
+def _unauthorized(authenticator, request, detail):
+    response = JsonResponse(detail, status=401)
+    response['WWW-Authenticate'] = authenticator.authenticate_header(request)
+    return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:42
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_alter_logintable_options_alter_signuptable_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='signuptable',
+            index=models.Index(django.db.models.functions.text.Upper('institution_name'), name='signup_inst_name_upper_idx'),
+        ),
+    ]
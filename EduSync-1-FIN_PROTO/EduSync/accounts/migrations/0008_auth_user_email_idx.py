@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-16 15:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Indexes auth_user.email, which signup (and the admin user search) filter on
+    by exact match; Django's User model leaves the column unindexed, and its Meta
+    cannot be changed from this app, so the index is created directly.
+    """
+
+    dependencies = [
+        ('accounts', '0007_signuptable_signup_inst_name_upper_idx'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS auth_user_email_idx ON auth_user (email);',
+            reverse_sql='DROP INDEX IF EXISTS auth_user_email_idx;',
+        ),
+    ]
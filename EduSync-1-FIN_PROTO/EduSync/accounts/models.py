@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import User
 
 class SignupTable(models.Model):
@@ -8,6 +9,12 @@ class SignupTable(models.Model):
     phone = models.CharField(max_length=15, blank=True, null=True)
     address = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        # Login and the token API look institutions up with institution_name__iexact,
+        # which compiles to UPPER(institution_name); an index on that expression
+        # lets the lookup seek instead of scanning (the unique index is case-sensitive)
+        indexes = [models.Index(Upper('institution_name'), name='signup_inst_name_upper_idx')]
     
     def __str__(self):
         return self.institution_name
@@ -1,54 +1,54 @@
 from rest_framework.permissions import BasePermission
 
+from .utils import get_user_profile
 
-class IsStudent(BasePermission):
+
+class _RolePermission(BasePermission):
     """
-    Permission class that only allows students to access the view.
+    Allows authenticated users whose role is in `allowed_roles`.
+    The profile is loaded through get_user_profile (the API views read it
+    next) and its role checked against a frozenset, the same way
+    accounts.decorators gates the pages.
     """
-    message = "Only students can access this resource."
+    allowed_roles = frozenset()
 
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
             return False
-        return hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'student'
+        profile = get_user_profile(request.user)
+        return profile is not None and profile.role in self.allowed_roles
+
+
+class IsStudent(_RolePermission):
+    """
+    Permission class that only allows students to access the view.
+    """
+    message = "Only students can access this resource."
+    allowed_roles = frozenset({'student'})
 
 
-class IsTeacher(BasePermission):
+class IsTeacher(_RolePermission):
     """
     Permission class that only allows teachers to access the view.
     """
     message = "Only teachers can access this resource."
-
-    def has_permission(self, request, view):
-        if not request.user.is_authenticated:
-            return False
-        return hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'teacher'
+    allowed_roles = frozenset({'teacher'})
 
 
-class IsInstitutionAdmin(BasePermission):
+class IsInstitutionAdmin(_RolePermission):
     """
     Permission class that only allows institution admins to access the view.
     """
     message = "Only institution administrators can access this resource."
-
-    def has_permission(self, request, view):
-        if not request.user.is_authenticated:
-            return False
-        return hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'institution_admin'
+    allowed_roles = frozenset({'institution_admin'})
 
 
-class IsTeacherOrAdmin(BasePermission):
+class IsTeacherOrAdmin(_RolePermission):
     """
     Permission class that allows teachers or institution admins.
     """
     message = "Only teachers or administrators can access this resource."
-
-    def has_permission(self, request, view):
-        if not request.user.is_authenticated:
-            return False
-        if not hasattr(request.user, 'userprofile'):
-            return False
-        return request.user.userprofile.role in ['teacher', 'institution_admin']
+    allowed_roles = frozenset({'teacher', 'institution_admin'})
 
 
 class IsSameInstitution(BasePermission):
@@ -64,10 +64,13 @@ class IsSameInstitution(BasePermission):
     def has_object_permission(self, request, view, obj):
         if not request.user.is_authenticated:
             return False
-        if not hasattr(request.user, 'userprofile'):
-            return False
-        
-        user_institution = request.user.userprofile.institution.lower()
+        # lowercased once per request; list views call this for every object
+        user_institution = getattr(request, '_edusync_institution_lower', None)
+        if user_institution is None:
+            profile = get_user_profile(request.user)
+            if profile is None:
+                return False
+            user_institution = request._edusync_institution_lower = profile.institution.lower()
         
         # Check if view has custom method
         if hasattr(view, 'get_institution_name'):
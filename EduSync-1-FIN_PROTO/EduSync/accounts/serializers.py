@@ -1,7 +1,8 @@
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from django.contrib.auth.models import User
-from .models import UserProfile, SignupTable
+from .models import UserProfile
+from .utils import get_user_profile, signup_exists
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -11,46 +12,39 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     institution_name = serializers.CharField(write_only=True, required=True)
     role = serializers.CharField(write_only=True, required=True)
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # Make username and password required
-        self.fields['username'] = serializers.CharField()
-        self.fields['password'] = serializers.CharField(write_only=True)
-
     def validate(self, attrs):
         institution_name = attrs.pop('institution_name', None)
         role = attrs.pop('role', None)
 
-        # First validate institution exists
-        try:
-            SignupTable.objects.get(institution_name__iexact=institution_name)
-        except SignupTable.DoesNotExist:
-            raise serializers.ValidationError({
-                'institution_name': f"Institution '{institution_name}' not found."
-            })
-
         # Call parent validation (authenticates user)
         data = super().validate(attrs)
 
         # Verify user profile and role match
         try:
-            profile = UserProfile.objects.get(user=self.user)
-            
-            if profile.institution.lower() != institution_name.lower():
-                raise serializers.ValidationError({
-                    'institution_name': f"This account is not registered under {institution_name}."
-                })
-            
-            if profile.role != role:
-                raise serializers.ValidationError({
-                    'role': f"Account found, but it is not a {role} account."
-                })
-                
+            # get_token() already loaded the profile during super().validate();
+            # user.userprofile returns that cached instance instead of a second query
+            profile = self.user.userprofile
         except UserProfile.DoesNotExist:
             raise serializers.ValidationError({
                 'detail': "User profile not found."
             })
 
+        if profile.institution.lower() != institution_name.lower():
+            # Only a mismatch pays for the SignupTable lookup, to tell an unknown
+            # institution apart from an account registered elsewhere
+            if not signup_exists(institution_name):
+                raise serializers.ValidationError({
+                    'institution_name': f"Institution '{institution_name}' not found."
+                })
+            raise serializers.ValidationError({
+                'institution_name': f"This account is not registered under {institution_name}."
+            })
+
+        if profile.role != role:
+            raise serializers.ValidationError({
+                'role': f"Account found, but it is not a {role} account."
+            })
+
         # Add custom claims to the token
         data['user'] = {
             'id': self.user.id,
@@ -93,6 +87,22 @@ class UserSerializer(serializers.ModelSerializer):
         fields = ['id', 'username', 'email', 'first_name', 'last_name', 'role', 'institution', 'phone']
         read_only_fields = ['id', 'username']
 
+    def to_representation(self, instance):
+        # Built by hand: this serializer is read-only on /api/auth/profile/, and the
+        # per-field get_attribute walk re-resolved `userprofile` for each of the
+        # three profile fields. Users without a profile get None for those, as before.
+        profile = get_user_profile(instance)
+        return {
+            'id': instance.id,
+            'username': instance.username,
+            'email': instance.email,
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'role': profile.role if profile else None,
+            'institution': profile.institution if profile else None,
+            'phone': profile.phone if profile else None,
+        }
+
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """Serializer for UserProfile model."""
@@ -0,0 +1,21 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import SignupTable
+from .utils import invalidate_signup_exists
+
+
+@receiver(pre_save, sender=SignupTable)
+def forget_previous_signup_name(sender, instance, **kwargs):
+    """A rename must also drop the cached answer for the name being given up."""
+    if instance.pk:
+        previous = SignupTable.objects.filter(pk=instance.pk).values_list('institution_name', flat=True).first()
+        if previous is not None and previous != instance.institution_name:
+            invalidate_signup_exists(previous)
+
+
+@receiver(post_save, sender=SignupTable)
+@receiver(post_delete, sender=SignupTable)
+def signup_changed(sender, instance, **kwargs):
+    """Drop the cached signup_exists() answer for the institution's name."""
+    invalidate_signup_exists(instance.institution_name)
@@ -1,32 +1,138 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Case, Q, Value, When
+
 from institution.models import Institution
 
+from .models import SignupTable, UserProfile
+
+# Cache key of "a SignupTable row exists for this institution name" (hashed
+# lowercased name, since names contain spaces); dropped on SignupTable changes.
+# Only positive answers are stored: the default cache is per-process, so a cached
+# "not found" would outlive a signup handled by another worker
+SIGNUP_EXISTS_CACHE_KEY = 'accounts:signup_exists:{}'
+
+# Seconds a cached positive answer lives; registered institutions are almost never renamed
+SIGNUP_EXISTS_TIMEOUT = 600
+
+# Marks "not looked up yet" for the per-request memos (None is a valid cached answer)
+_UNSET = object()
+
+
+def get_user_role(user):
+    """
+    Returns the user's UserProfile role, or None when the user has no profile.
+    The result is remembered on the user object, so the several role checks of one
+    request (decorators, views, context processors) share a single lookup.
+    """
+    role = getattr(user, '_edusync_role', _UNSET)
+    if role is _UNSET:
+        role = _lookup_role(user)
+        user._edusync_role = role
+    return role
+
+
+def _lookup_role(user):
+    """
+    Reads the role without building a UserProfile when the profile is not loaded yet.
+    Users fetched by ProfileModelBackend already carry their joined profile (or a
+    cached "no profile"), which is used as-is; anyone else costs one
+    SELECT role ... query.
+    """
+    if getattr(user, 'pk', None) is None:
+        # AnonymousUser / unsaved user: no profile
+        return None
+    profile_rel = _profile_relation()
+    if profile_rel.is_cached(user):
+        profile = profile_rel.get_cached_value(user)
+        return profile.role if profile is not None else None
+    return UserProfile.objects.filter(user_id=user.pk).values_list('role', flat=True).first()
+
+
+def get_user_profile(user):
+    """
+    Returns the user's UserProfile, or None when the user has no profile.
+    The profile is stored in the user's `userprofile` relation cache, so the
+    permission check and the view that follows (user.userprofile.institution, ...)
+    share one query; a missing profile is cached the same way Django does.
+    """
+    if getattr(user, 'pk', None) is None:
+        return None
+    profile_rel = _profile_relation()
+    if not profile_rel.is_cached(user):
+        profile_rel.set_cached_value(user, UserProfile.objects.filter(user_id=user.pk).first())
+    return profile_rel.get_cached_value(user)
+
+
+def _profile_relation():
+    """The User → UserProfile reverse relation, whose cache holds a loaded profile."""
+    return UserProfile._meta.get_field('user').remote_field
+
+
 def get_user_institution(user):
     """
     Retrieves the Institution associated with a given User.
     Supports Institution Admins, Teachers, Students, and UserProfiles.
     Returns None if no institution is found or user is not authenticated.
+    The result is remembered on the user object for the rest of the request.
     """
     if not user or not user.is_authenticated:
         return None
-    
-    # 1. Check if user is an Institution Admin (OneToOne relation)
-    try:
-        return Institution.objects.get(admin=user)
-    except Institution.DoesNotExist:
-        pass
-    
-    # 2. Check if user is a Teacher
-    if hasattr(user, 'teacher'):
-        return user.teacher.institution
-        
-    # 3. Check if user is a Student
-    if hasattr(user, 'student'):
-        return user.student.institution
-        
+
+    institution = getattr(user, '_edusync_institution', _UNSET)
+    if institution is _UNSET:
+        institution = _lookup_institution(user)
+        user._edusync_institution = institution
+    return institution
+
+
+def _lookup_institution(user):
+    # 1-3. Admin (OneToOne), Teacher or Student link, in that order of precedence,
+    # resolved by one query; match_rank keeps the precedence when several match
+    institution = (
+        Institution.objects
+        .filter(Q(admin=user) | Q(teacher__user=user) | Q(student__user=user))
+        .alias(match_rank=Case(
+            When(admin=user, then=Value(0)),
+            When(teacher__user=user, then=Value(1)),
+            default=Value(2),
+        ))
+        .order_by('match_rank')
+        .first()
+    )
+    if institution is not None:
+        return institution
+
     # 4. Fallback to UserProfile string check
-    if hasattr(user, 'userprofile'):
-        inst_name = user.userprofile.institution
-        if inst_name:
-            return Institution.objects.filter(name__iexact=inst_name).first()
-            
+    profile = get_user_profile(user)
+    if profile is not None and profile.institution:
+        return Institution.objects.filter(name__iexact=profile.institution).first()
+
     return None
+
+
+def _signup_cache_key(institution_name):
+    digest = hashlib.md5(institution_name.strip().lower().encode()).hexdigest()
+    return SIGNUP_EXISTS_CACHE_KEY.format(digest)
+
+
+def signup_exists(institution_name):
+    """
+    Whether an institution with this name (case-insensitive) has signed up.
+    Login checks this on every POST, so a positive answer is cached per name until
+    a SignupTable row is saved or deleted (see accounts/signals.py); unknown names
+    (rare, and a cheap indexed EXISTS) are looked up every time.
+    """
+    key = _signup_cache_key(institution_name)
+    if cache.get(key):
+        return True
+    exists = SignupTable.objects.filter(institution_name__iexact=institution_name).exists()
+    if exists:
+        cache.set(key, True, SIGNUP_EXISTS_TIMEOUT)
+    return exists
+
+
+def invalidate_signup_exists(institution_name):
+    """Drops the cached signup_exists() answer for the given name."""
+    cache.delete(_signup_cache_key(institution_name))
@@ -24,10 +24,19 @@ from django.views.decorators.http import require_http_methods  # Decorator to re
 from django.views.decorators.cache import never_cache  # Decorator to prevent caching
 from django.views.decorators.csrf import ensure_csrf_cookie, csrf_protect, csrf_exempt  # CSRF security decorators
 from django.contrib import messages  # System to show success/error messages to users
+from django.utils.html import format_html  # Builds HTML messages with the interpolated values escaped
+from django.db import IntegrityError, transaction  # Groups the signup inserts into one all-or-nothing unit
+from django.db.models import CharField, Q, Value  # Query helpers for the combined duplicate checks
 
 # Import our custom models from the current app and institution app
 from .models import UserProfile, LoginTable, SignupTable
 from institution.models import Institution
+from .utils import get_user_profile, get_user_role, signup_exists  # Request-memoized profile/role lookups, cached institution check
+
+# "Already logged in" warnings: fixed HTML with {} slots that format_html fills in escaped
+# (messages are shown as HTML, and the institution name is user-entered)
+ALREADY_LOGGED_IN_LOGIN_MSG = "⚠️ You are already logged in as {}. <a href='/logout/' class='alert-link'>Logout first</a> to switch accounts."
+ALREADY_LOGGED_IN_SIGNUP_MSG = "⚠️ You are already logged in as {} at {}. <a href='/logout/' class='alert-link'>Logout first</a> to register a new institution."
 
 
 # ==============================
@@ -111,8 +120,8 @@ def unified_login_view(request):
     # request.user.is_authenticated is a Django property that returns True if user has valid session
     if request.user.is_authenticated:
         # Show a message but still allow access to login page for role switching
-        current_role = getattr(request.user.userprofile, 'role', 'unknown') if hasattr(request.user, 'userprofile') else 'unknown'
-        messages.warning(request, f"⚠️ You are already logged in as {current_role}. <a href='/logout/' class='alert-link'>Logout first</a> to switch accounts.")
+        current_role = get_user_role(request.user) or 'unknown'
+        messages.warning(request, format_html(ALREADY_LOGGED_IN_LOGIN_MSG, current_role))
         # Don't auto-redirect - let them see the login form
 
     # STEP 3: Handle POST request (form submission)
@@ -136,13 +145,10 @@ def unified_login_view(request):
             return render(request, 'unified_login.html')
 
         # STEP 5: Verify that the institution exists in our database
-        try:
-            # SignupTable stores institution registration information
-            # .objects.get() tries to find exactly one matching record
-            # institution_name__iexact does case-insensitive exact match
-            signup = SignupTable.objects.get(institution_name__iexact=institution_name)
-        except SignupTable.DoesNotExist:
-            # This exception is raised when no matching institution is found
+        # SignupTable stores institution registration information
+        # signup_exists() does a case-insensitive match and caches the answer,
+        # so repeated logins for the same institution skip the query
+        if not signup_exists(institution_name):
             messages.error(request, f"❌ Institution '{institution_name}' not found.")
             return render(request, 'unified_login.html')
 
@@ -157,7 +163,9 @@ def unified_login_view(request):
             try:
                 # Get the user's profile which contains role and institution info
                 # UserProfile is connected to User with OneToOneField relationship
-                profile = UserProfile.objects.get(user=user)
+                # Reading it through user.userprofile caches it on the user, so
+                # _redirect_by_role() below reuses it instead of querying again
+                profile = user.userprofile
                 
                 # STEP 8: Verify institution match
                 # Check if user's institution matches what they entered in the form
@@ -275,9 +283,10 @@ def signup_view(request):
     # Check if user is already logged in (but allow access to signup page with warning)
     if request.user.is_authenticated:
         # Show a message but still allow access to signup page for new institution registration
-        current_role = getattr(request.user.userprofile, 'role', 'unknown') if hasattr(request.user, 'userprofile') else 'unknown'
-        current_institution = getattr(request.user.userprofile, 'institution', 'unknown') if hasattr(request.user, 'userprofile') else 'unknown'
-        messages.warning(request, f"⚠️ You are already logged in as {current_role} at {current_institution}. <a href='/logout/' class='alert-link'>Logout first</a> to register a new institution.")
+        profile = get_user_profile(request.user)
+        current_role = profile.role if profile is not None else 'unknown'
+        current_institution = profile.institution if profile is not None else 'unknown'
+        messages.warning(request, format_html(ALREADY_LOGGED_IN_SIGNUP_MSG, current_role, current_institution))
         # Don't auto-redirect - let them see the signup form
 
     if request.method == 'POST':
@@ -287,47 +296,60 @@ def signup_view(request):
         email = request.POST.get('email')
         password = request.POST.get('password')
         
-        # Check if institution name already exists
-        if Institution.objects.filter(name=institution_name).exists():
+        # Check if institution name already exists (Institution and SignupTable in one query)
+        institution_hits = set(
+            Institution.objects.filter(name=institution_name)
+            .values_list(Value('institution', output_field=CharField()), flat=True)
+            .union(
+                SignupTable.objects.filter(institution_name=institution_name)
+                .values_list(Value('signup', output_field=CharField()), flat=True)
+            )
+        )
+        if 'institution' in institution_hits:
             return render(request, 'signup.html', {'error': 'Institution already exists'})
         
-        if SignupTable.objects.filter(institution_name=institution_name).exists():
+        if 'signup' in institution_hits:
             return render(request, 'signup.html', {'error': 'Institution name already registered'})
         
-        # Check if username already exists
-        if User.objects.filter(username=username).exists():
+        # Check if username or email already exists (one query; a username clash is reported first)
+        user_hits = list(User.objects.filter(Q(username=username) | Q(email=email)).values_list('username', flat=True))
+        if username in user_hits:
             return render(request, 'signup.html', {'error': '❌ Username already exists. Please choose a different username.'})
         
-        # Check if email already exists
-        if User.objects.filter(email=email).exists():
+        if user_hits:
             return render(request, 'signup.html', {'error': '❌ Email already registered. Please use a different email.'})
         
         try:
-            # Create SignupTable entry (institution details)
-            signup = SignupTable.objects.create(
-                institution_name=institution_name,
-                email=email
-            )
+            # All five rows or none: a failure part-way must not leave a half-registered institution
+            with transaction.atomic():
+                # Create SignupTable entry (institution details)
+                signup = SignupTable.objects.create(
+                    institution_name=institution_name,
+                    email=email
+                )
             
-            # Create LoginTable entry (login credentials)
-            LoginTable.objects.create(
-                signup=signup,
-                institution_name=institution_name,
-                password=password
-            )
+                # Create LoginTable entry (login credentials)
+                LoginTable.objects.create(
+                    signup=signup,
+                    institution_name=institution_name,
+                    password=password
+                )
             
-            # Create user
-            user = User.objects.create_user(username=username, email=email, password=password)
+                # Create user
+                user = User.objects.create_user(username=username, email=email, password=password)
             
-            # Create UserProfile as institution admin
-            UserProfile.objects.create(user=user, role='institution_admin', institution=institution_name)
+                # Create UserProfile as institution admin
+                UserProfile.objects.create(user=user, role='institution_admin', institution=institution_name)
             
-            # Create Institution
-            Institution.objects.create(name=institution_name, admin=user, email=email)
+                # Create Institution
+                Institution.objects.create(name=institution_name, admin=user, email=email)
             
             # Don't auto-login, redirect to login page with success message
             messages.success(request, "✅ Account created successfully! Please log in to access your dashboard.")
             return redirect('login')
+        except IntegrityError:
+            # Another signup took the name/username/email between the checks above and the inserts
+            return render(request, 'signup.html', {'error': '❌ This institution, username or email was just registered. Please choose different details.'})
         except Exception as e:
             return render(request, 'signup.html', {'error': f'❌ Error creating account: {str(e)}'})
     
@@ -367,10 +389,5 @@ def logout_view(request):
     else:
         messages.info(request, "ℹ️ You were not logged in.")
     
-    # Force browser to not cache this response and ensure fresh session
-    response = redirect('landing')
-    response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-    response['Pragma'] = 'no-cache'
-    response['Expires'] = '0'
-    
-    return response 
+    # @never_cache marks the redirect no-cache/no-store/must-revalidate/private with a past Expires
+    return redirect('landing') 
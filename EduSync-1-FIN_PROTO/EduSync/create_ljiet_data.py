@@ -8,9 +8,11 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'EduSync.settings')
 django.setup()
 
 from django.contrib.auth.models import User
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
 from accounts.models import UserProfile, SignupTable, LoginTable
 from institution.models import Institution, Department
-from academics.models import Branch, Course
+from academics.models import Branch, Course, invalidate_course_rows
 from teacher.models import Teacher
 from student.models import Student
 from generator.models import Timetable, Room, Division, TimeSlot, TimetableEntry
@@ -18,6 +20,60 @@ from academics.models import AcademicCalendar, CalendarEvent
 from marksheet.models import TeacherSubject, Marksheet, Marks
 from datetime import date, timedelta
 
+
+def _random_phone():
+    """Indian mobile-style number (14 chars, fits the 15-char phone fields); far cheaper than Faker's locale-aware phone_number()."""
+    return f"+91-9{random.randint(100000000, 999999999)}"
+
+
+def _bulk_upsert_users(rows, password, role, inst_name):
+    """
+    Creates or updates the users in `rows` ((username, first_name, last_name, email)
+    tuples) and their UserProfiles with a handful of bulk queries.
+    Every seeded account of a role shares one password, so it is hashed only once.
+    Returns the users in the order of `rows`.
+    """
+    hashed_password = make_password(password)
+    usernames = [row[0] for row in rows]
+
+    existing = User.objects.in_bulk(usernames, field_name='username')
+    new_users, updated_users = [], []
+    for username, first_name, last_name, email in rows:
+        user = existing.get(username)
+        if user is None:
+            user = User(username=username)
+            new_users.append(user)
+        else:
+            updated_users.append(user)
+        user.password = hashed_password
+        user.first_name = first_name
+        user.last_name = last_name
+        user.email = email
+    User.objects.bulk_create(new_users, batch_size=500)
+    User.objects.bulk_update(updated_users, ['password', 'first_name', 'last_name', 'email'], batch_size=500)
+
+    users_by_name = User.objects.in_bulk(usernames, field_name='username')
+    users = [users_by_name[username] for username in usernames]
+
+    existing_profiles = {p.user_id: p for p in UserProfile.objects.filter(user__in=users)}
+    phones = [_random_phone() for _ in users]
+    new_profiles, updated_profiles = [], []
+    for user, phone in zip(users, phones):
+        profile = existing_profiles.get(user.id)
+        if profile is None:
+            profile = UserProfile(user=user)
+            new_profiles.append(profile)
+        else:
+            updated_profiles.append(profile)
+        profile.role = role
+        profile.institution = inst_name
+        profile.phone = phone
+    UserProfile.objects.bulk_create(new_profiles, batch_size=500)
+    UserProfile.objects.bulk_update(updated_profiles, ['role', 'institution', 'phone'], batch_size=500)
+
+    return users
+
+@transaction.atomic
 def create_ljiet_data():
     print("🚀 Starting dummy data generation for LJIET...")
 
@@ -91,14 +147,16 @@ def create_ljiet_data():
     print(f"✅ {len(branches)} Branches created")
 
     # 6. Create 30 random Classrooms (Rooms)
-    rooms = []
-    for i in range(1, 31):
-        room_num = f"L-{100 + i}"
-        room, _ = Room.objects.get_or_create(
-            number=room_num,
-            institution=institution
-        )
-        rooms.append(room)
+    # Only the missing rooms are inserted, in one INSERT; then all 30 are re-read for their PKs
+    room_numbers = [f"L-{100 + i}" for i in range(1, 31)]
+    existing_rooms = set(
+        Room.objects.filter(institution=institution, number__in=room_numbers).values_list('number', flat=True)
+    )
+    Room.objects.bulk_create(
+        [Room(number=num, institution=institution) for num in room_numbers if num not in existing_rooms],
+        batch_size=500
+    )
+    rooms = list(Room.objects.filter(institution=institution, number__in=room_numbers).order_by('number'))
     print(f"✅ {len(rooms)} Rooms created")
 
     # 7. Pre-create Subjects (Courses) before students to assign them
@@ -112,18 +170,22 @@ def create_ljiet_data():
         ("NW107", "Computer Networks"),
         ("PY108", "Python Programming")
     ]
-    subjects = []
-    for code, name in subj_list:
-        subj, _ = Course.objects.get_or_create(
-            code=code,
-            institution=institution,
-            defaults={
-                'name': name,
-                'department': random.choice(departments),
-                'credits': 4
-            }
-        )
-        subjects.append(subj)
+    existing_codes = set(
+        Course.objects.filter(institution=institution, code__in=[code for code, _ in subj_list]).values_list('code', flat=True)
+    )
+    new_subjects = [
+        Course(code=code, name=name, institution=institution, department=random.choice(departments), credits=4)
+        for code, name in subj_list if code not in existing_codes
+    ]
+    # bulk_create skips Course.save(), which normally fills display_label
+    for subj in new_subjects:
+        subj.display_label = subj.build_display_label()
+    Course.objects.bulk_create(new_subjects, batch_size=500)
+    subjects_by_code = {
+        subj.code: subj
+        for subj in Course.objects.filter(institution=institution, code__in=[code for code, _ in subj_list])
+    }
+    subjects = [subjects_by_code[code] for code, _ in subj_list]
     print(f"✅ {len(subjects)} Subjects created")
 
     # 8. Pre-create Divisions for assignment
@@ -153,70 +215,82 @@ def create_ljiet_data():
         ("Archana", "Prabhu"), ("Gaurav", "Taneja"), ("Shalini", "Hegde"), ("Pratik", "Shinde"), ("Nishi", "Bhardwaj")
     ]
     
-    for i in range(80001, 80036):
-        t_username = f"EMP{i}"
-        idx = i - 80001
-        first_name, last_name = teacher_names[idx]
-        
-        user, created = User.objects.get_or_create(username=t_username)
-        user.set_password(teacher_pass)
-        user.first_name = first_name
-        user.last_name = last_name
-        user.email = f"{t_username.lower()}@ljiet.edu.in"
-        user.save()
-            
-        profile, _ = UserProfile.objects.get_or_create(user=user)
-        profile.role = 'teacher'
-        profile.institution = inst_name
-        profile.phone = fake.phone_number()[:15]
-        profile.save()
-        
-        teacher, created = Teacher.objects.get_or_create(
-            user=user,
-            institution=institution,
-            defaults={
-                'employee_id': f"ID-{i}",
-                'department': random.choice(departments),
-                'branch': random.choice(branches),
-                'qualification': random.choice(quals),
-                'gender': random.choice(['M', 'F']),
-                'date_of_birth': fake.date_of_birth(minimum_age=25, maximum_age=60),
-                'phone': fake.phone_number()[:15],
-                'address': fake.address(),
-                'salary': random.randint(50000, 150000),
-                'contract_type': random.choice(contracts)
-            }
-        )
-        # If already exists, update details to ensure they are filled
-        if not created:
-            teacher.qualification = random.choice(quals)
-            teacher.gender = random.choice(['M', 'F'])
-            teacher.date_of_birth = fake.date_of_birth(minimum_age=25, maximum_age=60)
-            teacher.phone = fake.phone_number()[:15]
-            teacher.address = fake.address()
-            teacher.salary = random.randint(50000, 150000)
-            teacher.contract_type = random.choice(contracts)
-            teacher.save()
-
-        teachers.append(teacher)
+    # Users and profiles in bulk; the shared password is hashed once for all 35
+    t_ids = range(80001, 80036)
+    users = _bulk_upsert_users([
+        (f"EMP{i}", *teacher_names[i - 80001], f"emp{i}@ljiet.edu.in") for i in t_ids
+    ], teacher_pass, 'teacher', inst_name)
+
+    # Random picks and fake details for all teachers up front, read by index in the loop
+    n = len(users)
+    dept_pick = random.choices(departments, k=n)
+    branch_pick = random.choices(branches, k=n)
+    qual_pick = random.choices(quals, k=n)
+    gender_pick = random.choices(['M', 'F'], k=n)
+    contract_pick = random.choices(contracts, k=n)
+    salary_pick = [random.randint(50000, 150000) for _ in range(n)]
+    dob_pick = [fake.date_of_birth(minimum_age=25, maximum_age=60) for _ in range(n)]
+    phone_pick = [_random_phone() for _ in range(n)]
+    address_pick = [fake.address() for _ in range(n)]
+
+    existing_teachers = {t.user_id: t for t in Teacher.objects.filter(user__in=users, institution=institution)}
+    new_teachers, updated_teachers = [], []
+    for idx, (i, user) in enumerate(zip(t_ids, users)):
+        teacher = existing_teachers.get(user.id)
+        if teacher is None:
+            new_teachers.append(Teacher(
+                user=user,
+                institution=institution,
+                employee_id=f"ID-{i}",
+                department=dept_pick[idx],
+                branch=branch_pick[idx],
+                qualification=qual_pick[idx],
+                gender=gender_pick[idx],
+                date_of_birth=dob_pick[idx],
+                phone=phone_pick[idx],
+                address=address_pick[idx],
+                salary=salary_pick[idx],
+                contract_type=contract_pick[idx]
+            ))
+        else:
+            # If already exists, update details to ensure they are filled
+            teacher.qualification = qual_pick[idx]
+            teacher.gender = gender_pick[idx]
+            teacher.date_of_birth = dob_pick[idx]
+            teacher.phone = phone_pick[idx]
+            teacher.address = address_pick[idx]
+            teacher.salary = salary_pick[idx]
+            teacher.contract_type = contract_pick[idx]
+            updated_teachers.append(teacher)
+    Teacher.objects.bulk_create(new_teachers, batch_size=500)
+    Teacher.objects.bulk_update(updated_teachers, [
+        'qualification', 'gender', 'date_of_birth', 'phone', 'address', 'salary', 'contract_type'
+    ], batch_size=500)
+
+    teachers_by_user = {
+        t.user_id: t
+        for t in Teacher.objects.filter(user__in=users, institution=institution).select_related('user')
+    }
+    teachers = [teachers_by_user[user.id] for user in users]
     print(f"✅ {len(teachers)} Teachers created with full details")
 
     # Now link teachers to subjects - Ensure EVERY teacher has at least 1 subject
-    assigned_count = 0
-    # First, make sure every teacher has one
-    for t in teachers:
-        subj = random.choice(subjects)
-        TeacherSubject.objects.get_or_create(teacher=t.user, subject=subj)
-        subj.teachers.add(t)
-        assigned_count += 1
-    
-    # Then add some extra random assignments
-    for subj in subjects:
-        extras = random.sample(teachers, 2)
-        for t in extras:
-            TeacherSubject.objects.get_or_create(teacher=t.user, subject=subj)
-            subj.teachers.add(t)
-            assigned_count += 1
+    # First, make sure every teacher has one; then add some extra random assignments
+    pairs = list(zip(teachers, random.choices(subjects, k=len(teachers))))
+    pairs += [(t, subj) for subj in subjects for t in random.sample(teachers, 2)]
+
+    # One INSERT each for TeacherSubject and the Course.teachers join table;
+    # ignore_conflicts skips pairs that already exist (both are unique per teacher/subject)
+    TeacherSubject.objects.bulk_create(
+        [TeacherSubject(teacher=t.user, subject=subj) for t, subj in pairs],
+        ignore_conflicts=True, batch_size=500
+    )
+    CourseTeacher = Course.teachers.through
+    CourseTeacher.objects.bulk_create(
+        [CourseTeacher(course_id=subj.id, teacher_id=t.id) for t, subj in pairs],
+        ignore_conflicts=True, batch_size=500
+    )
+    assigned_count = len(pairs)
     print(f"✅ {assigned_count} total Teacher-Subject assignments created")
 
     # 10. Create 5 New Timetables and Divisions
@@ -237,40 +311,50 @@ def create_ljiet_data():
             }
         )
         
-        # Add basic TimeSlots if not exists
-        if tt.timeslots.count() == 0:
-            for j in range(1, 7):
-                TimeSlot.objects.create(
-                    timetable=tt,
-                    lecture_number=j,
-                    start_time=time(9 + j, 0),
-                    end_time=time(9 + j, 50)
-                )
-        
         # Add a Division for the timetable
         div, _ = Division.objects.get_or_create(
             timetable=tt,
             name=f"DIV-{i}"
         )
         all_divisions.append(div)
-        
-        # Add some dummy entries to show it works
-        slots = tt.timeslots.all()
-        if tt.entries.count() == 0:
-            for day_code, day_name in [('MON', 'Monday'), ('TUE', 'Tuesday')]:
-                for s_idx in range(min(3, slots.count())):
-                    slot = slots[s_idx]
-                    TimetableEntry.objects.create(
-                        timetable=tt,
-                        day=day_code,
-                        timeslot=slot,
-                        division=div,
-                        subject=random.choice(subjects),
-                        faculty=random.choice(teachers),
-                        room=random.choice(rooms)
-                    )
-        
         timetables.append(tt)
+
+    # Add basic TimeSlots to the timetables that have none, all in one INSERT
+    tt_ids = [tt.id for tt in timetables]
+    with_slots = set(TimeSlot.objects.filter(timetable_id__in=tt_ids).values_list('timetable_id', flat=True))
+    TimeSlot.objects.bulk_create([
+        TimeSlot(
+            timetable=tt,
+            lecture_number=j,
+            start_time=time(9 + j, 0),
+            end_time=time(9 + j, 50)
+        )
+        for tt in timetables if tt.id not in with_slots
+        for j in range(1, 7)
+    ], batch_size=500)
+
+    # Add some dummy entries to show it works (timetables without entries only)
+    slots_by_tt = {}
+    for slot in TimeSlot.objects.filter(timetable_id__in=tt_ids):
+        slots_by_tt.setdefault(slot.timetable_id, []).append(slot)
+    with_entries = set(TimetableEntry.objects.filter(timetable_id__in=tt_ids).values_list('timetable_id', flat=True))
+    entries = []
+    for tt, div in zip(timetables, all_divisions):
+        if tt.id in with_entries:
+            continue
+        slots = slots_by_tt.get(tt.id, [])
+        for day_code, day_name in [('MON', 'Monday'), ('TUE', 'Tuesday')]:
+            for slot in slots[:3]:
+                entries.append(TimetableEntry(
+                    timetable=tt,
+                    day=day_code,
+                    timeslot=slot,
+                    division=div,
+                    subject=random.choice(subjects),
+                    faculty=random.choice(teachers),
+                    room=random.choice(rooms)
+                ))
+    TimetableEntry.objects.bulk_create(entries, batch_size=500)
     print(f"✅ {len(timetables)} Timetables and {len(all_divisions)} Divisions created")
 
     # 11. Create 35 Students (STU80001 to STU80035)
@@ -288,71 +372,60 @@ def create_ljiet_data():
         ("Navya", "Hegde"), ("Krishiv", "Shinde"), ("Amara", "Bhardwaj"), ("Shaurya", "Das"), ("Tanvi", "Chatterjee")
     ]
     
-    for i in range(80001, 80036):
-        s_username = f"STU{i}"
-        idx = i - 80001
-        first_name, last_name = student_names[idx]
-        
-        user, created = User.objects.get_or_create(username=s_username)
-        user.set_password(student_pass)
-        user.first_name = first_name
-        user.last_name = last_name
-        user.email = f"{s_username.lower()}@student.ljiet.edu.in"
-        user.save()
-            
-        profile, _ = UserProfile.objects.get_or_create(user=user)
-        profile.role = 'student'
-        profile.institution = inst_name
-        profile.phone = fake.phone_number()[:15]
-        profile.save()
-        
-        # Randomly assign dept, branch, course, division
-        dept = random.choice(departments)
-        branch = random.choice(branches)
-        course = random.choice(subjects)
-        division = random.choice(all_divisions)
-        
-        student, created = Student.objects.get_or_create(
-            user=user,
-            institution=institution,
-            defaults={
-                'student_id': f"S-ID-{i}",
-                'department': dept,
-                'branch': branch,
-                'course': course,
-                'division': division,
-                'phone': fake.phone_number()[:15],
-                'address': fake.address(),
-                'gender': random.choice(['M', 'F']),
-                'date_of_birth': fake.date_of_birth(minimum_age=17, maximum_age=22),
-                'blood_group': random.choice(blood_groups),
-                'parent_name': fake.name(),
-                'parent_phone': fake.phone_number()[:15],
-                'academic_year': "2024-2025",
-                'semester': random.randint(1, 8),
-                'gpa': round(random.uniform(5.0, 10.0), 2),
-                'status': 'active'
-            }
-        )
-        # If already exists, update details to ensure they are filled
-        if not created:
-            student.department = dept
-            student.branch = branch
-            student.course = course
-            student.division = division
-            student.phone = fake.phone_number()[:15]
-            student.address = fake.address()
-            student.gender = random.choice(['M', 'F'])
-            student.date_of_birth = fake.date_of_birth(minimum_age=17, maximum_age=22)
-            student.blood_group = random.choice(blood_groups)
-            student.parent_name = fake.name()
-            student.parent_phone = fake.phone_number()[:15]
-            student.academic_year = "2024-2025"
-            student.semester = random.randint(1, 8)
-            student.gpa = round(random.uniform(5.0, 10.0), 2)
-            student.save()
-
-        students.append(student)
+    # Users and profiles in bulk; the shared password is hashed once for all 35
+    s_ids = range(80001, 80036)
+    users = _bulk_upsert_users([
+        (f"STU{i}", *student_names[i - 80001], f"stu{i}@student.ljiet.edu.in") for i in s_ids
+    ], student_pass, 'student', inst_name)
+
+    # Randomly assign dept, branch, course, division (and fake details) for all students up front
+    n = len(users)
+    dept_pick = random.choices(departments, k=n)
+    branch_pick = random.choices(branches, k=n)
+    course_pick = random.choices(subjects, k=n)
+    division_pick = random.choices(all_divisions, k=n)
+    gender_pick = random.choices(['M', 'F'], k=n)
+    blood_pick = random.choices(blood_groups, k=n)
+    semester_pick = [random.randint(1, 8) for _ in range(n)]
+    gpa_pick = [round(random.uniform(5.0, 10.0), 2) for _ in range(n)]
+    dob_pick = [fake.date_of_birth(minimum_age=17, maximum_age=22) for _ in range(n)]
+    phone_pick = [_random_phone() for _ in range(n)]
+    address_pick = [fake.address() for _ in range(n)]
+    parent_pick = [fake.name() for _ in range(n)]
+    parent_phone_pick = [_random_phone() for _ in range(n)]
+
+    existing_students = {s.user_id: s for s in Student.objects.filter(user__in=users, institution=institution)}
+    new_students, updated_students = [], []
+    for idx, (i, user) in enumerate(zip(s_ids, users)):
+        student = existing_students.get(user.id)
+        if student is None:
+            student = Student(user=user, institution=institution, student_id=f"S-ID-{i}", status='active')
+            new_students.append(student)
+        else:
+            # If already exists, update details to ensure they are filled
+            updated_students.append(student)
+        student.department = dept_pick[idx]
+        student.branch = branch_pick[idx]
+        student.course = course_pick[idx]
+        student.division = division_pick[idx]
+        student.phone = phone_pick[idx]
+        student.address = address_pick[idx]
+        student.gender = gender_pick[idx]
+        student.date_of_birth = dob_pick[idx]
+        student.blood_group = blood_pick[idx]
+        student.parent_name = parent_pick[idx]
+        student.parent_phone = parent_phone_pick[idx]
+        student.academic_year = "2024-2025"
+        student.semester = semester_pick[idx]
+        student.gpa = gpa_pick[idx]
+    Student.objects.bulk_create(new_students, batch_size=500)
+    Student.objects.bulk_update(updated_students, [
+        'department', 'branch', 'course', 'division', 'phone', 'address', 'gender', 'date_of_birth',
+        'blood_group', 'parent_name', 'parent_phone', 'academic_year', 'semester', 'gpa'
+    ], batch_size=500)
+
+    students_by_user = {s.user_id: s for s in Student.objects.filter(user__in=users, institution=institution)}
+    students = [students_by_user[user.id] for user in users]
     print(f"✅ {len(students)} Students created with full details")
 
     # 12. Create 3 News Items
@@ -362,17 +435,21 @@ def create_ljiet_data():
         "Important: The mid-semester examination for SY departments will commence from March 10th, 2026.",
         "LJIET has been awarded the 'Best Innovative Campus' award for 2025. Congratulations to all members!"
     ]
-    for content in news_contents:
-        News.objects.get_or_create(content=content, institution=institution)
+    existing_news = set(
+        News.objects.filter(institution=institution, content__in=news_contents).values_list('content', flat=True)
+    )
+    News.objects.bulk_create(
+        [News(content=content, institution=institution) for content in news_contents if content not in existing_news],
+        batch_size=500
+    )
     print(f"✅ 3 News items created")
 
     # 13. Create 2 Academic Calendars with Details
-    from academics.models import AcademicCalendar, CalendarEvent
+    from academics.models import AcademicCalendar, CalendarEvent, Term
     from datetime import date, timedelta
     
     cal1, _ = AcademicCalendar.objects.get_or_create(
-        semester="Odd Semester",
-        year="2025-2026",
+        term=Term.objects.get_or_create(name="Odd Semester", year="2025-2026")[0],
         defaults={
             'created_by': admin_user,
             'institution': institution,
@@ -383,8 +460,7 @@ def create_ljiet_data():
     )
     
     cal2, _ = AcademicCalendar.objects.get_or_create(
-        semester="Even Semester",
-        year="2025-2026",
+        term=Term.objects.get_or_create(name="Even Semester", year="2025-2026")[0],
         defaults={
             'created_by': admin_user,
             'institution': institution,
@@ -404,13 +480,21 @@ def create_ljiet_data():
         (cal2, "Final Exams", date(2026, 4, 15), "Test")
     ]
     
-    for cal, title, dt, etype in event_list:
-        CalendarEvent.objects.get_or_create(
+    type_colors = CalendarEvent.resolved_colors()
+    existing_events = set(
+        CalendarEvent.objects.filter(calendar__in=[cal1, cal2]).values_list('calendar_id', 'date', 'title')
+    )
+    CalendarEvent.objects.bulk_create([
+        CalendarEvent(
             calendar=cal,
             date=dt,
             title=title,
-            defaults={'type': etype, 'color_code': CalendarEvent.color_for_type(etype) if hasattr(CalendarEvent, 'color_for_type') else '#2563EB'}
+            type=etype,
+            color_code=CalendarEvent.color_for_type(etype, type_colors)
         )
+        for cal, title, dt, etype in event_list
+        if (cal.id, dt, title) not in existing_events
+    ], batch_size=500)
     print(f"✅ 2 Academic Calendars created with events")
 
     # 14. Enrich Course details
@@ -418,7 +502,9 @@ def create_ljiet_data():
         subj.description = f"This course {subj.name} ({subj.code}) covers comprehensive topics in {subj.name} for engineering students at LJIET. It includes both theoretical foundations and practical laboratory sessions."
         subj.tuition_fee = 7500.00
         subj.duration_months = 6
-        subj.save()
+    Course.objects.bulk_update(subjects, ['description', 'tuition_fee', 'duration_months'], batch_size=500)
+    # bulk writes send no post_save, so drop the cached course list here
+    invalidate_course_rows(institution.id)
     print(f"✅ All Courses updated with detailed descriptions")
 
     print("\n🏁 Success! LJIET Dummy Data generation complete.")
@@ -6,6 +6,7 @@ class TimetableAdmin(admin.ModelAdmin):
     list_display = ['name', 'institution', 'department', 'course', 'created_by', 'status', 'created_at', 'is_active']
     list_filter = ['institution', 'department', 'is_active', 'status']
     search_fields = ['name', 'institution__name', 'department__name', 'course__name']
+    list_select_related = ['institution', 'department', 'course', 'created_by']
     readonly_fields = ['created_at']
     fieldsets = (
         ('Basic Information', {
@@ -32,18 +33,21 @@ class TimetableAdmin(admin.ModelAdmin):
 class RoomAdmin(admin.ModelAdmin):
     list_display = ['number', 'institution']
     list_filter = ['institution']
+    list_select_related = ['institution']
     search_fields = ['number']
 
 @admin.register(Division)
 class DivisionAdmin(admin.ModelAdmin):
     list_display = ['name', 'timetable']
     list_filter = ['timetable']
+    list_select_related = ['timetable']
     search_fields = ['name']
 
 @admin.register(TimeSlot)
 class TimeSlotAdmin(admin.ModelAdmin):
     list_display = ['lecture_number', 'start_time', 'end_time', 'is_break', 'timetable']
     list_filter = ['is_break', 'timetable']
+    list_select_related = ['timetable']
     ordering = ['lecture_number']
 
 @admin.register(TimetableEntry)
@@ -51,3 +55,5 @@ class TimetableEntryAdmin(admin.ModelAdmin):
     list_display = ['timetable', 'day', 'timeslot', 'division', 'subject', 'faculty', 'room']
     list_filter = ['day', 'timetable', 'division']
     search_fields = ['subject__name', 'faculty__user__first_name', 'faculty__user__last_name']
+    # faculty's __str__ reads user.username
+    list_select_related = ['timetable', 'timeslot', 'division', 'subject', 'faculty__user', 'room']
@@ -20,7 +20,7 @@ class TimetableEntryForm(forms.ModelForm):
             
             # CRITICAL: Always filter by institution to prevent cross-institution data exposure
             if institution:
-                self.fields['subject'].queryset = Course.objects.filter(institution=institution)
+                self.fields['subject'].queryset = Course.objects.filter(institution=institution).lite()
                 self.fields['faculty'].queryset = Teacher.objects.filter(institution=institution)
                 self.fields['room'].queryset = Room.objects.filter(institution=institution)
             else:
@@ -148,7 +148,7 @@ class SetupForm(forms.Form):
         if institution:
             # Set department queryset based on institution
             self.fields['department'].queryset = Department.objects.filter(institution=institution)
-            self.fields['course'].queryset = Course.objects.filter(institution=institution)
+            self.fields['course'].queryset = Course.objects.filter(institution=institution).lite()
             
             # If user is a teacher, auto-select and restrict to their department
             if user and hasattr(user, 'teacher'):
@@ -161,7 +161,7 @@ class SetupForm(forms.Form):
                         self.fields['course'].queryset = Course.objects.filter(
                             institution=institution,
                             department=teacher.department
-                        )
+                        ).lite()
                 except Exception:
                     pass
         else:
@@ -238,7 +238,7 @@ class PublishTimetableForm(forms.Form):
 
         if institution:
             self.fields['department'].queryset = Department.objects.filter(institution=institution)
-            self.fields['branch'].queryset = Branch.objects.filter(institution=institution)
+            self.fields['branch'].queryset = Branch.objects.filter(institution=institution).lite()
 
         if timetable:
             self.fields['name'].initial = timetable.name
@@ -18,7 +18,7 @@ from reportlab.lib.pagesizes import landscape, letter
 from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle
 
-from accounts.utils import get_user_institution
+from accounts.utils import get_user_institution, get_user_role
 
 
 @login_required
@@ -522,7 +522,7 @@ def publish_timetable(request, timetable_id):
 
     # Permission check: creator, admin, or any teacher from the same institution can publish
     is_creator = (request.user == timetable.created_by)
-    is_admin = (hasattr(request.user, 'userprofile') and request.user.userprofile.role == 'institution_admin')
+    is_admin = get_user_role(request.user) == 'institution_admin'
     is_teacher = hasattr(request.user, 'teacher')
 
     if not (is_creator or is_admin or is_teacher):
@@ -1,3 +1,4 @@
+from accounts.utils import get_user_role
 from .models import News, Institution
 
 def news_processor(request):
@@ -9,16 +10,13 @@ def news_processor(request):
 
     if request.user.is_authenticated:
         # Resolve correct dashboard URL based on role
-        try:
-            role = request.user.userprofile.role
-            if role == 'institution_admin':
-                dashboard_url = 'institution_admin_dashboard'
-            elif role == 'teacher':
-                dashboard_url = 'teacher_dashboard'
-            elif role == 'student':
-                dashboard_url = 'student_dashboard'
-        except Exception:
-            pass
+        role = get_user_role(request.user)
+        if role == 'institution_admin':
+            dashboard_url = 'institution_admin_dashboard'
+        elif role == 'teacher':
+            dashboard_url = 'teacher_dashboard'
+        elif role == 'student':
+            dashboard_url = 'student_dashboard'
 
         # Fetch news for the user's institution
         try:
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:42
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('institution', '0008_academiccalendarevent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='institution',
+            index=models.Index(django.db.models.functions.text.Upper('name'), name='institution_name_upper_idx'),
+        ),
+    ]
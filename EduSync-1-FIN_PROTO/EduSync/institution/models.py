@@ -27,6 +27,7 @@
 
 # Import Django's database models module
 from django.db import models
+from django.db.models.functions import Upper
 # Import Django's built-in User model for authentication
 from django.contrib.auth.models import User
 
@@ -93,6 +94,17 @@ class Institution(models.Model):
     # auto_now_add=True automatically sets this when the record is first created
     # This field is never updated after creation (different from auto_now=True)
     created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        """
+        META CLASS: Additional options for the Institution model
+        
+        indexes: Case-insensitive name lookups
+        - Index on UPPER(name): profile and API lookups match institutions with
+          name__iexact, which compiles to UPPER(name) = UPPER(%s). The unique
+          index on name is case-sensitive, so without this one those lookups scan
+        """
+        indexes = [models.Index(Upper('name'), name='institution_name_upper_idx')]
     
     def __str__(self):
         """
@@ -13,7 +13,7 @@ from institution.models import Department, Institution
 from academics.models import Course as Subject # Using existing Course model alias
 from student.models import Student  # Use existing Student model
 from accounts.models import UserProfile
-from accounts.utils import get_user_institution
+from accounts.utils import get_user_institution, get_user_role
 from .models import TeacherSubject, Marksheet, Marks
 
 # ===================================
@@ -232,7 +232,7 @@ def student_my_marksheet(request):
             try:
                 target_student_user = User.objects.get(id=student_id)
                 # Verify the user is actually a student AND belongs to the same institution
-                if not hasattr(target_student_user, 'userprofile') or target_student_user.userprofile.role != 'student':
+                if get_user_role(target_student_user) != 'student':
                     messages.error(request, "Invalid student selected.")
                     return redirect('landing')
                 
@@ -6,3 +6,7 @@ class StudentAdmin(admin.ModelAdmin):
     list_display = ('student_id', 'user', 'institution', 'gpa')
     list_filter = ('status', 'institution')
     search_fields = ('student_id', 'user__username')
+
+    def get_queryset(self, request):
+        # __str__ shows the user's full name, so autocomplete results and FK widgets need it joined
+        return super().get_queryset(request).select_related('user')
@@ -37,7 +37,10 @@ class StudentProfileAPIView(APIView):
     def patch(self, request):
         """Update student's own profile (limited fields)."""
         try:
-            student = Student.objects.get(user=request.user)
+            # the response serializes the same relations as GET, so join them here too
+            student = Student.objects.select_related(
+                'user', 'institution', 'course', 'branch', 'department'
+            ).get(user=request.user)
             
             # Only allow updating certain fields
             allowed_fields = ['phone', 'address', 'blood_group']
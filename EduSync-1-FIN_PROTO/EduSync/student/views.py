@@ -42,7 +42,7 @@ from datetime import date
 
 # Import models from different apps
 from .models import Student
-from academics.models import Grade, AcademicCalendar, CalendarEvent, Attendance
+from academics.models import Grade, AcademicCalendar, CalendarEvent, EventOccurrence, Attendance
 from institution.models import Institution
 from accounts.models import UserProfile
 from generator.models import Timetable, TimetableEntry
@@ -265,8 +265,8 @@ def student_dashboard(request):
         # Get the student record for the current user
         student = Student.objects.get(user=request.user)
         
-        # Get all grades for this student
-        grades = Grade.objects.filter(student=student)
+        # Get all grades for this student as flat transcript rows (no model instances)
+        grades = Grade.objects.filter(student=student).transcript()
         
         # Find matching timetable using helper function
         active_tt = _find_student_timetable(student)
@@ -314,15 +314,11 @@ def student_dashboard(request):
 
         # Calculate attendance statistics from shared attendance sheets
         # Only show attendance that teachers have chosen to share with students
-        shared_attendance_records = Attendance.objects.filter(
-            student=student,                      # This specific student
-            sheet__shared_with_students=True,     # Only shared attendance sheets
-        )
-        
-        # Calculate summary statistics
-        shared_attendance_count = shared_attendance_records.count()
-        shared_total_attended = sum(r.lectures_attended for r in shared_attendance_records)
-        shared_total_lectures = sum(r.total_lectures for r in shared_attendance_records)
+        # One aggregate query, cached per student (shared cache only) until their attendance changes
+        shared_summary = Attendance.objects.shared_summary(student.id)
+        shared_attendance_count = shared_summary['count']
+        shared_total_attended = shared_summary['attended']
+        shared_total_lectures = shared_summary['lectures']
         
         # Calculate overall attendance percentage with division by zero protection
         if shared_total_lectures > 0:
@@ -336,10 +332,16 @@ def student_dashboard(request):
         shared_calendars = AcademicCalendar.objects.filter(shared_with_students=True)
         
         # Get next 5 upcoming events for dashboard display
-        calendar_events = CalendarEvent.objects.filter(
-            calendar__in=shared_calendars,    # From shared calendars only
-            date__gte=date.today()           # Only future events
-        ).order_by('date')[:5]               # Limit to 5 most immediate events
+        # Multi-day events are shown on their next occurrence date
+        today = date.today()
+        calendar_events = EventOccurrence.upcoming(
+            CalendarEvent.objects.filter(
+                CalendarEvent.upcoming_q(today),  # Events still occurring today or later
+                calendar__in=shared_calendars     # From shared calendars only
+            ).for_cards(),                        # Card columns only
+            today, 5                              # upcoming() ranks by next occurrence and keeps 5; no SQL slice,
+                                                  # since an ongoing range can start early but recur later
+        )
 
         # Prepare all data for template rendering
         context = {
@@ -620,7 +622,7 @@ def my_attendance(request):
     attendance_records = Attendance.objects.filter(
         student=student,
         sheet__shared_with_students=True,
-    ).select_related('sheet__teacher__user', 'sheet__department').order_by('-sheet__created_at')
+    ).select_related('sheet__teacher__user', 'sheet__department').with_percentage().order_by('-sheet__created_at')
 
     total_attended = sum(r.lectures_attended for r in attendance_records)
     total_lectures = sum(r.total_lectures for r in attendance_records)
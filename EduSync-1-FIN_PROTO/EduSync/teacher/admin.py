@@ -5,4 +5,4 @@ from .models import Teacher
 class TeacherAdmin(admin.ModelAdmin):
     list_display = ('employee_id', 'user', 'institution')
     list_filter = ('institution',)
-    search_fields = ('employee_id', 'user__username')
+    search_fields = ('employee_id', 'user__username', 'user__email')
@@ -37,7 +37,10 @@ class TeacherProfileAPIView(APIView):
     def patch(self, request):
         """Update teacher's own profile (limited fields)."""
         try:
-            teacher = Teacher.objects.get(user=request.user)
+            # the response serializes the same relations as GET, so join them here too
+            teacher = Teacher.objects.select_related(
+                'user', 'institution', 'department', 'branch'
+            ).get(user=request.user)
             
             # Only allow updating certain fields
             allowed_fields = ['phone', 'address', 'qualification']
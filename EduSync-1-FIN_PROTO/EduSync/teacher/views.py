@@ -5,7 +5,9 @@ from django.contrib.auth.decorators import login_required
 from django.views.decorators.cache import never_cache
 from django.views.decorators.csrf import ensure_csrf_cookie
 from .models import Teacher
-from academics.models import Course, AttendanceSheet, AcademicCalendar, CalendarEvent
+from academics.models import (
+    Course, Attendance, AttendanceSheet, AcademicCalendar, CalendarEvent, EventOccurrence, ATTENDANCE_MIN_PERCENTAGE,
+)
 
 from student.models import Student
 from institution.models import Institution
@@ -75,10 +77,13 @@ def teacher_dashboard(request):
         # (department field is informational, not a visibility restriction)
         shared_calendars = AcademicCalendar.objects.filter(shared_with_teachers=True)
         
-        calendar_events = CalendarEvent.objects.filter(
-            calendar__in=shared_calendars,
-            date__gte=date.today()
-        ).order_by('date')[:5]
+        today = date.today()
+        # upcoming() ranks by next occurrence and keeps 5; no SQL slice on the start date,
+        # since an ongoing range event can start early but next occur after a sooner event
+        calendar_events = EventOccurrence.upcoming(
+            CalendarEvent.objects.filter(CalendarEvent.upcoming_q(today), calendar__in=shared_calendars).for_cards(),
+            today, 5
+        )
 
         context = {
             'teacher': teacher,
@@ -299,11 +304,16 @@ def attendance_archives(request):
         messages.error(request, 'Teacher profile not found.')
         return redirect('login')
 
-    sheets = AttendanceSheet.objects.filter(teacher=teacher).select_related('department').order_by('-created_at')
+    sheets = list(AttendanceSheet.objects.filter(teacher=teacher).select_related('department').order_by('-created_at'))
+    # class average / below-minimum counts, cached per sheet when the cache is shared
+    summaries = Attendance.objects.sheet_summaries([sheet.id for sheet in sheets])
+    for sheet in sheets:
+        sheet.summary = summaries[sheet.id]
 
     context = {
         'teacher': teacher,
         'sheets': sheets,
+        'min_percentage': ATTENDANCE_MIN_PERCENTAGE,
     }
     return render(request, 'teacher/attendance_archives.html', context)
 
@@ -311,7 +321,9 @@ def attendance_archives(request):
 @login_required(login_url='login')
 def attendance_sheet(request, dept_id, date_from, date_to, total_lectures):
     """Generate and display attendance sheet for students"""
-    from academics.models import AttendanceSheet as Sheet, Attendance
+    from academics.models import (
+        AttendanceSheet as Sheet, Attendance, invalidate_attendance_summaries, invalidate_sheet_summaries,
+    )
     from institution.models import Department
     from student.models import Student
     from datetime import datetime
@@ -336,6 +348,11 @@ def attendance_sheet(request, dept_id, date_from, date_to, total_lectures):
         messages.error(request, 'Invalid date format.')
         return redirect('attendance_generator')
 
+    # The database rejects sheets whose period ends before it starts
+    if date_to_obj < date_from_obj:
+        messages.error(request, 'End date cannot be earlier than the start date.')
+        return redirect('attendance_generator')
+
     total_lectures = int(total_lectures)
 
     # Get or create AttendanceSheet
@@ -348,7 +365,7 @@ def attendance_sheet(request, dept_id, date_from, date_to, total_lectures):
     )
     if sheet.total_lectures != total_lectures:
         sheet.total_lectures = total_lectures
-        sheet.save(update_fields=['total_lectures', 'updated_at'])
+        sheet.save(update_fields=['total_lectures'])
 
     # Get students in this department
     students = Student.objects.filter(
@@ -368,40 +385,40 @@ def attendance_sheet(request, dept_id, date_from, date_to, total_lectures):
             records_to_create.append(Attendance(
                 sheet=sheet,
                 student=student,
-                total_lectures=total_lectures,
                 lectures_attended=0
             ))
     
     if records_to_create:
-        Attendance.objects.bulk_create(records_to_create)
-    
-    # Update existing records if total_lectures changed
-    existing_records.exclude(total_lectures=total_lectures).update(total_lectures=total_lectures)
+        Attendance.objects.bulk_create(records_to_create, batch_size=1000)
+        invalidate_attendance_summaries(r.student_id for r in records_to_create)
+        invalidate_sheet_summaries([sheet.pk])
 
     # Get attendance records
-    attendance_records = Attendance.objects.filter(sheet=sheet).select_related('student__user').order_by('student__student_id')
+    attendance_records = Attendance.objects.filter(sheet=sheet).select_related('student__user', 'sheet').with_percentage().order_by('student__student_id')
 
     if request.method == 'POST':
-        # Update attendance records
+        # Update attendance records, writing only the rows that changed in one batch
+        changed_rows = []
         for record in attendance_records:
             lectures_attended = request.POST.get(f'lectures_attended_{record.id}')
             if lectures_attended is not None:
                 try:
                     attended = int(lectures_attended)
-                    if 0 <= attended <= record.total_lectures:
-                        record.lectures_attended = attended
-                        record.save()
+                    if 0 <= attended <= total_lectures and attended != record.lectures_attended:
+                        changed_rows.append((record.student_id, attended))
                 except ValueError:
                     pass
+        if changed_rows:
+            Attendance.objects.bulk_upsert(sheet, changed_rows)
 
         action = request.POST.get('action', 'save')
         if action == 'share':
             sheet.shared_with_students = True
-            sheet.save(update_fields=['shared_with_students', 'updated_at'])
+            sheet.save(update_fields=['shared_with_students'])
             messages.success(request, 'Attendance saved and shared with students.')
         elif action == 'unshare':
             sheet.shared_with_students = False
-            sheet.save(update_fields=['shared_with_students', 'updated_at'])
+            sheet.save(update_fields=['shared_with_students'])
             messages.success(request, 'Attendance saved and unshared from students.')
         else:
             messages.success(request, 'Attendance saved.')